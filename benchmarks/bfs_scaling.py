@@ -0,0 +1,69 @@
+# Regression benchmark: BFS time must grow linearly with the number of expanded states.
+# Runs BFS on the bundled puzzles (small to large state spaces) and checks that the
+# cost per expanded state stays flat (normalised by the states generated, since some
+# boards have more legal moves per state). Exits with status 1 if it grows past --threshold.
+#
+#   python benchmarks/bfs_scaling.py [--threshold 3.0] [--bitboard]
+import argparse
+import glob
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import RushHourPuzzle, BFS  # noqa: E402
+
+
+def run(filename, bitboard):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(filename)
+    puzzle.setBoard()
+    start = puzzle.toBitboard() if bitboard else puzzle
+
+    expanded = 0
+    generated = 0
+
+    def successors(state):
+        nonlocal expanded, generated
+        children = state.successorFunction()
+        expanded += 1
+        generated += len(children)
+        return children
+
+    node, elapsed = BFS(start, successors, lambda state: state.isGoal())
+    cost = len(node.getSolution()) if node else None
+    return expanded, generated, elapsed, cost
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BFS linear scaling regression benchmark")
+    parser.add_argument("--threshold", type=float, default=3.0,
+                        help="max allowed ratio between the slowest and fastest per-state cost")
+    parser.add_argument("--bitboard", action="store_true", help="search over BitboardState")
+    args = parser.parse_args()
+
+    rows = []
+    for filename in sorted(glob.glob(os.path.join(ROOT, "*.csv"))):
+        expanded, generated, elapsed, cost = run(filename, args.bitboard)
+        rows.append((os.path.basename(filename), expanded, generated, elapsed, cost))
+
+    rows.sort(key=lambda row: row[1])
+    print(f"{'puzzle':<10} {'cost':>5} {'expanded':>9} {'generated':>10} {'time (s)':>9} "
+          f"{'us/expanded':>12} {'us/generated':>13}")
+    for name, expanded, generated, elapsed, cost in rows:
+        print(f"{name:<10} {cost!s:>5} {expanded:>9} {generated:>10} {elapsed:>9.3f} "
+              f"{1e6 * elapsed / expanded:>12.1f} {1e6 * elapsed / generated:>13.2f}")
+
+    # Linear scaling means the cost per state does not depend on the state count
+    per_state = [elapsed / generated for _, _, generated, elapsed, _ in rows]
+    ratio = max(per_state) / min(per_state)
+    print(f"\nper-state cost ratio (max/min): {ratio:.2f} (threshold {args.threshold})")
+    if ratio > args.threshold:
+        print("FAIL: BFS does not scale linearly with expanded states")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Expanded nodes and time of BidirectionalBFS against BFS on the bundled puzzles
+# (or the CSV files given on the command line). Both must return the same cost.
+#
+#   python benchmarks/bidirectional.py [puzzle.csv ...]
+import argparse
+import glob
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import RushHourPuzzle  # noqa: E402
+from solver.search import GOAL_LIMIT  # noqa: E402
+from solver.solve import runAlgorithm  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bidirectional BFS vs BFS")
+    parser.add_argument("puzzles", nargs="*", default=sorted(glob.glob(os.path.join(ROOT, "*.csv"))))
+    args = parser.parse_args()
+
+    print(f"{'puzzle':<12} {'goals':>7} {'cost':>5} {'BFS exp':>9} {'bidir exp':>10} {'ratio':>6} "
+          f"{'BFS (s)':>8} {'bidir (s)':>9}")
+    failed = False
+    for filename in args.puzzles:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(filename)
+        puzzle.setBoard()
+        start = puzzle.toBitboard()
+        # "-" past GOAL_LIMIT, where the bidirectional search runs a plain BFS
+        goals = start.info.goalLayouts(start.layout, GOAL_LIMIT)
+        goals = "-" if goals is None else len(goals)
+
+        bfs, bfs_time, bfs_stats = runAlgorithm("BFS", puzzle)
+        bfs_expanded = bfs_stats.expanded
+        bidir, bidir_time, bidir_stats = runAlgorithm("Bidirectional BFS", puzzle)
+        bidir_expanded = bidir_stats.expanded
+
+        bfs_cost = len(bfs.getSolution()) if bfs else None
+        bidir_cost = len(bidir.getSolution()) if bidir else None
+        if bfs_cost != bidir_cost:
+            failed = True
+        print(f"{os.path.basename(filename):<12} {goals:>7} {bidir_cost!s:>5} {bfs_expanded:>9} "
+              f"{bidir_expanded:>10} {bidir_expanded / max(bfs_expanded, 1):>6.2f} "
+              f"{bfs_time:>8.3f} {bidir_time:>9.3f}")
+
+    if failed:
+        print("FAIL: bidirectional BFS cost differs from BFS")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
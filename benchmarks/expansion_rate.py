@@ -0,0 +1,56 @@
+# Node expansion rate of RushHourPuzzle.successorFunction.
+# Collects the first --states states of a BFS over each puzzle, then times how many of
+# them can be expanded per second (best of --repeat runs, fresh states every run).
+#
+#   python benchmarks/expansion_rate.py [1.csv e-f.csv ...] [--states 3000] [--repeat 5]
+import argparse
+import os
+import sys
+import time
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import RushHourPuzzle  # noqa: E402
+
+
+def collect_states(filename, limit):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(filename)
+    puzzle.setBoard()
+
+    states = [puzzle]
+    seen = {puzzle}
+    queue = deque([puzzle])
+    while queue and len(states) < limit:
+        for _, child in queue.popleft().successorFunction():
+            if child not in seen:
+                seen.add(child)
+                queue.append(child)
+                states.append(child)
+    return states
+
+
+def main():
+    parser = argparse.ArgumentParser(description="successorFunction expansion rate")
+    parser.add_argument("puzzles", nargs="*", default=["1.csv", "e-f.csv"])
+    parser.add_argument("--states", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'puzzle':<10} {'states':>7} {'expanded/s':>11} {'generated/s':>12}")
+    for name in args.puzzles:
+        filename = name if os.path.exists(name) else os.path.join(ROOT, name)
+        best = None
+        for _ in range(args.repeat):
+            states = collect_states(filename, args.states)
+            start = time.perf_counter()
+            generated = sum(len(state.successorFunction()) for state in states)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{os.path.basename(name):<10} {len(states):>7} {len(states) / best:>11.0f} {generated / best:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
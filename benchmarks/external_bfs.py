@@ -0,0 +1,61 @@
+# Peak memory and time of the external-memory BFS (ExternalBFS, layers on disk
+# with delayed duplicate detection) against the in-memory bitboard BFS on the
+# bundled puzzles (or the CSV files given on the command line), with a small
+# RAM ceiling so the sorted runs and layer merges are exercised. Both must
+# return the same cost.
+#
+#   python benchmarks/external_bfs.py [puzzle.csv ...] [--budget-kb 256]
+import argparse
+import glob
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import BFS, ExternalBFS, RushHourPuzzle  # noqa: E402
+from solver.solve import isGoal, successors  # noqa: E402
+
+
+def measure(search):
+    # (solution, elapsed, peak traced memory in MB)
+    tracemalloc.start()
+    solution, elapsed = search()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return solution, elapsed, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="external-memory BFS vs in-memory BFS")
+    parser.add_argument("puzzles", nargs="*", default=sorted(glob.glob(os.path.join(ROOT, "*.csv"))))
+    parser.add_argument("--budget-kb", type=int, default=256, help="RAM ceiling of the external BFS")
+    args = parser.parse_args()
+    budget = args.budget_kb * 1024
+
+    print(f"{'puzzle':<12} {'cost':>5} {'BFS (s)':>8} {'BFS MB':>7} {'ext (s)':>8} {'ext MB':>7}")
+    failed = False
+    for filename in args.puzzles:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(filename)
+        puzzle.setBoard()
+        start = puzzle.toBitboard()
+
+        bfs, bfs_time, bfs_mb = measure(lambda: BFS(start, successors, isGoal))
+        ext, ext_time, ext_mb = measure(lambda: ExternalBFS(start, successors, isGoal, budget))
+
+        bfs_cost = len(bfs.getSolution()) if bfs else None
+        ext_cost = len(ext.getSolution()) if ext else None
+        if bfs_cost != ext_cost:
+            failed = True
+        print(f"{os.path.basename(filename):<12} {ext_cost!s:>5} {bfs_time:>8.3f} {bfs_mb:>7.2f} "
+              f"{ext_time:>8.3f} {ext_mb:>7.2f}")
+
+    if failed:
+        print("FAIL: external-memory BFS cost differs from BFS")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
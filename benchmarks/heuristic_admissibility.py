@@ -0,0 +1,90 @@
+# Checks that h4 and the pattern database never overestimate: every state
+# reachable from each puzzle gets its exact distance to the nearest goal
+# (breadth-first search backwards from all goal states; moves are reversible)
+# and neither heuristic may exceed it. Also compares their A* runs with BFS on
+# expanded nodes and throughput.
+#
+#   python benchmarks/heuristic_admissibility.py [puzzle.csv ...]
+import argparse
+import glob
+import os
+import sys
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import Node, PatternDatabase, RushHourPuzzle, h4  # noqa: E402
+from solver.solve import runAlgorithm  # noqa: E402
+
+
+def exactDistances(start):
+    # Reachable states and their neighbours, then BFS from every goal state
+    neighbours = {start: []}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        for _, child in state.successorFunction():
+            neighbours[state].append(child)
+            if child not in neighbours:
+                neighbours[child] = []
+                queue.append(child)
+
+    distance = {state: 0 for state in neighbours if state.isGoal()}
+    queue = deque(distance)
+    while queue:
+        state = queue.popleft()
+        for child in neighbours[state]:
+            if child not in distance:
+                distance[child] = distance[state] + 1
+                queue.append(child)
+    return distance
+
+
+def main():
+    parser = argparse.ArgumentParser(description="heuristic admissibility and A* comparison")
+    parser.add_argument("puzzles", nargs="*", default=sorted(glob.glob(os.path.join(ROOT, "*.csv"))))
+    args = parser.parse_args()
+
+    print(f"{'puzzle':<12} {'h':<4} {'states':>7} {'h <= d':>7} {'mean h/d':>8} {'cost':>5} "
+          f"{'BFS exp':>8} {'A* exp':>7} {'BFS exp/s':>10} {'A* exp/s':>9}")
+    failed = False
+    for filename in args.puzzles:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(filename)
+        puzzle.setBoard()
+
+        distance = exactDistances(puzzle)
+        bfs, bfs_time, bfs_stats = runAlgorithm("BFS", puzzle)
+        bfs_expanded = bfs_stats.expanded
+        cost = len(bfs.getSolution()) if bfs else None
+
+        heuristics = [("h4", h4, "A* (h4)"), ("PDB", PatternDatabase(puzzle), "A* (PDB)")]
+        for name, h, algorithm in heuristics:
+            violations = 0
+            ratio = 0.0
+            for state, d in distance.items():
+                value = h(Node(state))
+                if value > d:
+                    violations += 1
+                    if violations == 1:
+                        print(f"{name} = {value} > {d} on:")
+                        state.display()
+                ratio += value / d if d else 1.0
+
+            astar, astar_time, astar_stats = runAlgorithm(algorithm, puzzle)
+            astar_expanded = astar_stats.expanded
+            if violations or (len(astar.getSolution()) if astar else None) != cost:
+                failed = True
+
+            print(f"{os.path.basename(filename):<12} {name:<4} {len(distance):>7} "
+                  f"{'yes' if not violations else violations:>7} {ratio / len(distance):>8.2f} "
+                  f"{cost!s:>5} {bfs_expanded:>8} {astar_expanded:>7} "
+                  f"{bfs_expanded / max(bfs_time, 1e-9):>10.0f} {astar_expanded / max(astar_time, 1e-9):>9.0f}")
+
+    if failed:
+        print("FAIL: a heuristic overestimates or its A* is not optimal")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Cold import time of the solver core. Each sample runs a fresh interpreter, imports
+# the module and checks that pygame was not loaded. Exits with status 1 if the median
+# import time exceeds --budget milliseconds or if pygame shows up.
+#
+#   python benchmarks/import_time.py [--module solver] [--budget 50] [--runs 10]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "pygame": "pygame" in sys.modules}}))
+"""
+
+
+def sample(module):
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="solver cold import time")
+    parser.add_argument("--module", default="solver")
+    parser.add_argument("--budget", type=float, default=50.0, help="median budget in milliseconds")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [sample(args.module) for _ in range(args.runs)]
+    times = [s["ms"] for s in samples]
+    median = statistics.median(times)
+    print(f"import {args.module}: median {median:.1f} ms, min {min(times):.1f} ms, "
+          f"max {max(times):.1f} ms (budget {args.budget:.0f} ms)")
+
+    failed = False
+    if any(s["pygame"] for s in samples):
+        print("FAIL: importing the solver loaded pygame")
+        failed = True
+    if median > args.budget:
+        print("FAIL: import time over budget")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Scaling benchmark for large boards: random boards from 6x6 up to 20x20 (with
+# up to 60+ vehicles), searched breadth-first for a fixed number of expansions
+# with the grid representation (RushHourPuzzle), the bitboard one
+# (BitboardState) and the layout-only BFS with a disk-backed frontier. Prints
+# microseconds per expansion and bytes of memory per visited state for each.
+#
+#   python benchmarks/large_boards.py [--sizes 6 8 10 12 16 20] [--expansions 5000]
+#                                     [--budget-kb 64] [--seed 1]
+#
+# The disk frontier run gets only --budget-kb of frontier memory so the spill
+# path is exercised: its peak frontier is printed next to the number of
+# layouts that budget keeps in memory.
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import BFS, DiskFrontierBFS, SearchStats  # noqa: E402
+from solver.frontier import layoutsPerBudget  # noqa: E402
+from solver.generator import SearchLimit, randomPuzzle  # noqa: E402
+
+
+def vehiclesFor(size):
+    # About one vehicle per six cells: 6 on 6x6, 66 on 20x20
+    return max(6, size * size // 6)
+
+
+def neverGoal(state):
+    # Every run expands the same number of states, solvable or not
+    return False
+
+
+def run(search, start, expansions, measure_memory):
+    # (microseconds per expansion or bytes per visited state, stats) of a
+    # search stopped after `expansions` expansions
+    stats = SearchStats()
+
+    def successors(state):
+        if stats.expanded > expansions:
+            raise SearchLimit()
+        return state.successorFunction()
+
+    if measure_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        search(start, successors, stats)
+    except SearchLimit:
+        pass
+    elapsed = time.perf_counter() - started
+    if measure_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak / max(1, stats.generated - stats.duplicates), stats
+    return 1e6 * elapsed / max(1, stats.expanded), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="large board scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 8, 10, 12, 16, 20])
+    parser.add_argument("--expansions", type=int, default=5000, help="expansions per run")
+    parser.add_argument("--budget-kb", type=int, default=64, help="frontier memory of the disk frontier run")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    budget = args.budget_kb * 1024
+
+    def bfs(start, successors, stats):
+        return BFS(start, successors, neverGoal, stats=stats)
+
+    def disk(start, successors, stats):
+        return DiskFrontierBFS(start, successors, neverGoal, budget, stats=stats)
+
+    print(f"{'board':>6} {'vehicles':>8} {'expanded':>8} "
+          f"{'grid us':>8} {'bits us':>8} {'disk us':>8} "
+          f"{'grid B':>7} {'bits B':>7} {'disk B':>7} {'frontier':>8} {'in RAM':>7}")
+    rng = random.Random(args.seed)
+    for size in args.sizes:
+        puzzle = randomPuzzle(rng, size, size, vehiclesFor(size))
+        bitboard = puzzle.toBitboard()
+
+        grid_us, _ = run(bfs, puzzle, args.expansions, False)
+        bits_us, stats = run(bfs, bitboard, args.expansions, False)
+        disk_us, disk_stats = run(disk, bitboard, args.expansions, False)
+        grid_bytes, _ = run(bfs, puzzle, args.expansions, True)
+        bits_bytes, _ = run(bfs, bitboard, args.expansions, True)
+        disk_bytes, _ = run(disk, bitboard, args.expansions, True)
+
+        print(f"{size:>3}x{size:<2} {len(puzzle.vehicles):>8} {stats.expanded:>8} "
+              f"{grid_us:>8.1f} {bits_us:>8.1f} {disk_us:>8.1f} "
+              f"{grid_bytes:>7.0f} {bits_bytes:>7.0f} {disk_bytes:>7.0f} "
+              f"{disk_stats.peak_open:>8} {layoutsPerBudget(bitboard.info, budget):>7}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
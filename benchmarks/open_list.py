@@ -0,0 +1,66 @@
+# A* open lists compared on the bundled puzzles (or the CSV files given on the
+# command line): the binary heap against the BucketQueue with LIFO and with
+# lowest-h tie-breaking, for the integer heuristics h2, h4 and the pattern
+# database. Prints expanded nodes, Open pushes and the median time of --repeat
+# runs over BitboardState. Admissible heuristics must return the same cost
+# with every open list.
+#
+#   python benchmarks/open_list.py [puzzle.csv ...] [--repeat 3]
+import argparse
+import glob
+import os
+import statistics
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import AStar, PatternDatabase, RushHourPuzzle, SearchStats, h2, h4  # noqa: E402
+from solver.solve import isGoal, successors  # noqa: E402
+
+OPEN_LISTS = [("heap", "lifo"), ("bucket", "lifo"), ("bucket", "h")]
+
+
+def run(start, h, open_list, tie_break, repeat):
+    # (cost, expanded, pushes, median seconds)
+    times = []
+    for _ in range(repeat):
+        stats = SearchStats(sample=64)
+        solution, elapsed = AStar(start, successors, isGoal, h, stats=stats,
+                                  open_list=open_list, tie_break=tie_break)
+        times.append(elapsed)
+    cost = len(solution.getSolution()) if solution else None
+    return cost, stats.expanded, stats.pushes, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A* heap vs bucket open list")
+    parser.add_argument("puzzles", nargs="*", default=sorted(glob.glob(os.path.join(ROOT, "*.csv"))))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    args = parser.parse_args()
+
+    header = "".join(f" {f'{name}/{tie}':>26}" for name, tie in OPEN_LISTS)
+    print(f"{'puzzle':<12} {'h':<4}{header}")
+    print(f"{'':<12} {'':<4}" + f" {'cost exp push s':>26}" * len(OPEN_LISTS))
+    failed = False
+    for filename in args.puzzles:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(filename)
+        puzzle.setBoard()
+        start = puzzle.toBitboard()
+
+        for name, h, admissible in (("h2", h2, False), ("h4", h4, True), ("PDB", PatternDatabase(puzzle), True)):
+            results = [run(start, h, open_list, tie_break, args.repeat) for open_list, tie_break in OPEN_LISTS]
+            if admissible and len({cost for cost, _, _, _ in results}) > 1:
+                failed = True
+            cells = "".join(f" {cost!s:>4} {expanded:>7} {pushes:>7} {seconds:>6.3f}"
+                            for cost, expanded, pushes, seconds in results)
+            print(f"{os.path.basename(filename):<12} {name:<4}{cells}", flush=True)
+
+    if failed:
+        print("FAIL: open lists disagree on an optimal cost")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
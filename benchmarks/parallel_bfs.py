@@ -0,0 +1,52 @@
+# Scaling of the hash-partitioned parallel BFS (ParallelBFS) with the number of
+# worker processes, against the serial bitboard BFS, on the bundled puzzles (or
+# the CSV files given on the command line). Prints the time of each run and its
+# speedup over BFS; every run must return the BFS cost. Speedups need as many
+# free cores as workers: the CPU count is printed first.
+#
+#   python benchmarks/parallel_bfs.py [puzzle.csv ...] [--workers 1 2 4 8]
+import argparse
+import glob
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import BFS, ParallelBFS, RushHourPuzzle  # noqa: E402
+from solver.solve import isGoal, successors  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parallel BFS scaling")
+    parser.add_argument("puzzles", nargs="*", default=sorted(glob.glob(os.path.join(ROOT, "*.csv"))))
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs")
+    header = "".join(f" {f'{workers} workers':>16}" for workers in args.workers)
+    print(f"{'puzzle':<12} {'cost':>5} {'BFS (s)':>8}{header}")
+    failed = False
+    for filename in args.puzzles:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(filename)
+        puzzle.setBoard()
+        start = puzzle.toBitboard()
+
+        bfs, bfs_time = BFS(start, successors, isGoal)
+        cost = len(bfs.getSolution()) if bfs else None
+        cells = ""
+        for workers in args.workers:
+            solution, elapsed = ParallelBFS(start, successors, isGoal, workers=workers)
+            if (len(solution.getSolution()) if solution else None) != cost:
+                failed = True
+            cells += f" {elapsed:>8.3f} {bfs_time / max(elapsed, 1e-9):>6.2f}x"
+        print(f"{os.path.basename(filename):<12} {cost!s:>5} {bfs_time:>8.3f}{cells}", flush=True)
+
+    if failed:
+        print("FAIL: parallel BFS cost differs from BFS")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# Benchmark suite: every algorithm of solve_with_all_algorithms on every bundled
+# puzzle plus a generated hard set, repeated, with median / p90 time, nodes per
+# second and peak memory. Results go to a JSON file; --compare flags regressions
+# against an earlier one.
+#
+#   python benchmarks/suite.py [--repeat 5] [--output results.json]
+#   python benchmarks/suite.py --compare baseline.json [--threshold 0.10] [--min-delta 0.01]
+#
+# The hard set is built with solver.generator.generate from --seed: the
+# --hard-count hardest positions of --hard-attempts random 6x6 boards, the same
+# boards on every run. Each (puzzle, algorithm) runs in a fresh worker process
+# so peak memory is its own; runs are sequential unless --workers is set.
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import signal
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import RushHourPuzzle  # noqa: E402
+from solver.batch import SolveTimeout, _onAlarm  # noqa: E402
+from solver.generator import generate  # noqa: E402
+from solver.solve import ALGORITHMS, runAlgorithm  # noqa: E402
+
+
+def percentile(values, q):
+    # Linear interpolation between the closest ranks
+    values = sorted(values)
+    position = (len(values) - 1) * q
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def hardSet(directory, count, attempts, seed):
+    # The count hardest of attempts random 6x6 boards (solver.generator, with a
+    # fixed seed so every run benchmarks the same boards), written as CSV files
+    files = []
+    for i, (_, puzzle) in enumerate(generate(count, attempts=attempts, seed=seed)):
+        path = os.path.join(directory, f"hard-{i:02d}.csv")
+        puzzle.saveVehicles(path)
+        files.append(path)
+    return files
+
+
+def runTask(task):
+    # Runs in its own worker process: every repetition of one algorithm on one puzzle
+    label, filename, algorithm, repeat, timeout = task
+    result = {"puzzle": label, "algorithm": algorithm, "status": "solved"}
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    times = []
+    use_alarm = timeout and hasattr(signal, "SIGALRM")
+    try:
+        for _ in range(repeat):
+            puzzle = RushHourPuzzle()
+            puzzle.setVehicles(filename)
+            puzzle.setBoard()
+            if use_alarm:
+                signal.signal(signal.SIGALRM, _onAlarm)
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+            try:
+                solution, elapsed, stats = runAlgorithm(algorithm, puzzle)
+            finally:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            times.append(elapsed)
+    except SolveTimeout:
+        result["status"] = "timeout"
+    except Exception as exc:  # report the failure and keep the suite going
+        result["status"] = "error"
+        result["error"] = f"{type(exc).__name__}: {exc}"
+
+    if times and result["status"] == "solved":
+        median = statistics.median(times)
+        result.update({
+            "cost": len(solution.getSolution()) if solution else None,
+            "expanded": stats.expanded,
+            "generated": stats.generated,
+            "runs": len(times),
+            "median": round(median, 6),
+            "p90": round(percentile(times, 0.9), 6),
+            "min": round(min(times), 6),
+            "max": round(max(times), 6),
+            "nodes_per_second": round(stats.expanded / median) if median else None,
+        })
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["peak_mb"] = round(max(0, peak - baseline_rss) / scale, 2)
+    return result
+
+
+def runSuite(files, algorithms, repeat, timeout, workers):
+    tasks = [(os.path.basename(filename), filename, algorithm, repeat, timeout)
+             for filename in files for algorithm in algorithms]
+    results = []
+    with multiprocessing.Pool(workers, maxtasksperchild=1) as pool:
+        for result in pool.imap(runTask, tasks):
+            results.append(result)
+            if result["status"] == "solved":
+                print(f"{result['puzzle']:<14} {result['algorithm']:<18} {result['cost']!s:>5} "
+                      f"{result['expanded']:>8} {result['median']:>9.4f} {result['p90']:>9.4f} "
+                      f"{result['nodes_per_second']!s:>8} {result['peak_mb']:>8.1f}", flush=True)
+            else:
+                print(f"{result['puzzle']:<14} {result['algorithm']:<18} {result['status']}", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold, min_delta):
+    # Regressions: median slower by more than threshold (relative) and min_delta
+    # seconds, more expanded nodes, a different cost, or a run that no longer solves
+    old = {(r["puzzle"], r["algorithm"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = old.get((result["puzzle"], result["algorithm"]))
+        if before is None or before["status"] != "solved":
+            continue
+        name = f"{result['puzzle']} / {result['algorithm']}"
+        if result["status"] != "solved":
+            regressions.append(f"{name}: {result['status']} (was solved)")
+            continue
+        if result["cost"] != before["cost"]:
+            regressions.append(f"{name}: cost {before['cost']} -> {result['cost']}")
+        if result["expanded"] > before["expanded"]:
+            regressions.append(f"{name}: expanded {before['expanded']} -> {result['expanded']}")
+        if (result["median"] > before["median"] * (1 + threshold)
+                and result["median"] - before["median"] > min_delta):
+            change = result["median"] / before["median"] - 1
+            regressions.append(f"{name}: median {before['median']:.4f}s -> {result['median']:.4f}s (+{change:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="solver benchmark suite with regression tracking")
+    parser.add_argument("puzzles", nargs="*", default=sorted(glob.glob(os.path.join(ROOT, "*.csv"))))
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS),
+                        metavar="NAME")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per puzzle and algorithm")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per run")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="parallel worker processes (more than 1 disturbs the timings)")
+    parser.add_argument("--no-hard", action="store_true", help="skip the generated hard set")
+    parser.add_argument("--hard-count", type=int, default=5, help="puzzles in the hard set")
+    parser.add_argument("--hard-attempts", type=int, default=50,
+                        help="random boards the hard set is chosen from")
+    parser.add_argument("--seed", type=int, default=1, help="random seed of the hard set")
+    parser.add_argument("--output", default="benchmark-results.json", help="results file to write")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against this results file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed relative slowdown of the median time (default 0.10)")
+    parser.add_argument("--min-delta", type=float, default=0.01,
+                        help="ignore slowdowns smaller than this many seconds (default 0.01)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as hard_dir:
+        files = list(args.puzzles)
+        if not args.no_hard:
+            files += hardSet(hard_dir, args.hard_count, args.hard_attempts, args.seed)
+
+        print(f"{'puzzle':<14} {'algorithm':<18} {'cost':>5} {'expanded':>8} {'median s':>9} "
+              f"{'p90 s':>9} {'nodes/s':>8} {'peak MB':>8}")
+        results = runSuite(files, args.algorithms, args.repeat, args.timeout, args.workers)
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "timeout": args.timeout,
+            "hard": None if args.no_hard else {"count": args.hard_count, "attempts": args.hard_attempts,
+                                               "seed": args.seed},
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
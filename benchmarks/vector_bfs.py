@@ -0,0 +1,72 @@
+# Throughput of the NumPy layer-at-a-time BFS (VectorBFS) against the bitboard
+# BFS on a generated corpus of larger boards (8x8 and up by default), or on the
+# CSV files given on the command line. Both must return the same cost; prints
+# states expanded per second and the speedup.
+#
+#   python benchmarks/vector_bfs.py [puzzle.csv ...] [--sizes 8 10] [--count 3] [--seed 1]
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from solver import BFS, RushHourPuzzle, SearchStats  # noqa: E402
+from solver.generator import generate  # noqa: E402
+from solver.solve import isGoal, successors  # noqa: E402
+from solver.vectorized import VectorBFS  # noqa: E402
+
+
+def corpus(args):
+    # (label, puzzle) pairs: the given files, or generated hard boards
+    if args.puzzles:
+        for filename in args.puzzles:
+            puzzle = RushHourPuzzle()
+            puzzle.setVehicles(filename)
+            puzzle.setBoard()
+            yield os.path.basename(filename), puzzle
+        return
+    for size in args.sizes:
+        found = generate(args.count, size, size, vehicles=size * size // 4, attempts=args.attempts,
+                         max_states=args.max_states, seed=args.seed)
+        for i, (moves, puzzle) in enumerate(found):
+            yield f"{size}x{size}-{i} ({moves})", puzzle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NumPy layer BFS vs bitboard BFS")
+    parser.add_argument("puzzles", nargs="*")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 10])
+    parser.add_argument("--count", type=int, default=3, help="generated puzzles per size")
+    parser.add_argument("--attempts", type=int, default=20, help="random boards tried per size")
+    parser.add_argument("--max-states", type=int, default=100000, help="generator state budget")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'puzzle':<16} {'cost':>5} {'BFS exp':>8} {'BFS s':>7} {'exp/s':>8} "
+          f"{'NumPy exp':>9} {'NumPy s':>8} {'exp/s':>9} {'speedup':>7}")
+    failed = False
+    for label, puzzle in corpus(args):
+        start = puzzle.toBitboard()
+        bfs_stats = SearchStats(sample=64)
+        bfs, bfs_time = BFS(start, successors, isGoal, stats=bfs_stats)
+        vector_stats = SearchStats()
+        vector, vector_time = VectorBFS(start, stats=vector_stats)
+
+        bfs_cost = len(bfs.getSolution()) if bfs else None
+        vector_cost = len(vector.getSolution()) if vector else None
+        if bfs_cost != vector_cost:
+            failed = True
+        bfs_rate = bfs_stats.expanded / max(bfs_time, 1e-9)
+        vector_rate = vector_stats.expanded / max(vector_time, 1e-9)
+        print(f"{label:<16} {vector_cost!s:>5} {bfs_stats.expanded:>8} {bfs_time:>7.3f} {bfs_rate:>8.0f} "
+              f"{vector_stats.expanded:>9} {vector_time:>8.3f} {vector_rate:>9.0f} "
+              f"{bfs_time / max(vector_time, 1e-9):>6.1f}x", flush=True)
+
+    if failed:
+        print("FAIL: NumPy BFS cost differs from BFS")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
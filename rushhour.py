@@ -1,12 +1,23 @@
-import csv
-from collections import deque
-import time
-import heapq
-import pygame  # type: ignore
 import sys
 
-# Initialize Pygame
-pygame.init()
+from solver import (  # noqa: F401  (re-exported for existing callers)
+    Vehicle, RushHourPuzzle, BoardInfo, BitboardState, Node,
+    BFS, AStar, h1, h2, h3, solve_with_all_algorithms,
+)
+from solver.solve import VISUALIZER_ALGORITHMS
+
+# pygame is imported and initialised by loadPygame() the first time a
+# visualizer is created, so importing this module stays cheap for headless use
+pygame = None
+
+
+def loadPygame():
+    global pygame
+    if pygame is None:
+        import pygame as module  # type: ignore
+        module.init()
+        pygame = module
+    return pygame
 
 # Constants
 SCREEN_WIDTH = 1300
@@ -36,463 +47,9 @@ VEHICLE_COLORS = {
     'J': ((135, 206, 250), (100, 150, 200)),  # Light Sky Blue
 }
 
-class Vehicle:
-    def __init__(self, vid, x, y, orientation, length):
-        self.vid = vid
-        self.row = int(y)              
-        self.col = int(x)              
-        self.orientation = orientation 
-        self.length = int(length)
-
-    def __repr__(self):
-        return f"Vehicle({self.vid}, {self.col}, {self.row}, {self.orientation}, {self.length})"
-
-
-class RushHourPuzzle:
-    def __init__(self):
-        self.board_height = 0
-        self.board_width = 0
-        self.vehicles = []
-        self.walls = []
-        self.board = []
-
-    def setVehicles(self, filename):
-        with open(filename, newline="") as f:
-            reader = csv.reader(f)
-            lines = list(reader)
-
-        # First line = board dimensions
-        self.board_height, self.board_width = map(int, lines[0])
-
-        # Reset vehicles and walls
-        self.vehicles = []
-        self.walls = []
-
-        # Load each line
-        for line in lines[1:]:
-            if line[0] == "#":
-                # It's a wall (format: #,x,y)
-                x, y = int(line[1]), int(line[2])
-                self.walls.append((y, x))  # store as (row, col)
-            else:
-                # It's a vehicle
-                vid, x, y, orientation, length = line
-                self.vehicles.append(Vehicle(vid, x, y, orientation, length))
-
-    def setBoard(self):
-        self.board = [["." for _ in range(self.board_width)] for _ in range(self.board_height)]
-
-        # Place vehicles
-        for v in self.vehicles:
-            if v.orientation == "H":
-                for i in range(v.length):
-                    self.board[v.row][v.col + i] = v.vid
-            else:  # Vertical
-                for i in range(v.length):
-                    self.board[v.row + i][v.col] = v.vid
-
-        # Place walls
-        for (r, c) in self.walls:
-            self.board[r][c] = "#"
-
-    def display(self):
-        for row in self.board:
-            print(" ".join(row))
-        print()
-
-    def isGoal(self):
-        # Find the red car
-        red_car = None
-        for v in self.vehicles:
-            if v.vid == 'X':
-                red_car = v
-                break
-        
-        if not red_car:
-            return False
-        
-        if red_car.orientation == "H":
-            # Check if front of red car is at the rightmost column
-            return red_car.col + red_car.length == self.board_width
-        return False
-
-    def successorFunction(self):
-        successors = []
-        
-        # Create a temporary board for collision detection
-        temp_board = [["." for _ in range(self.board_width)] for _ in range(self.board_height)]
-        
-        # Place walls on temp board
-        for (r, c) in self.walls:
-            temp_board[r][c] = "#"
-            
-        # Place vehicles on temp board
-        for v in self.vehicles:
-            if v.orientation == "H":
-                for i in range(v.length):
-                    temp_board[v.row][v.col + i] = v.vid
-            else:  # Vertical
-                for i in range(v.length):
-                    temp_board[v.row + i][v.col] = v.vid
-        
-        # Try to move each vehicle
-        for idx, vehicle in enumerate(self.vehicles):
-            # Try moving left/up (negative direction)
-            for move_amount in range(1, self.board_width if vehicle.orientation == "H" else self.board_height):
-                new_col = vehicle.col - move_amount if vehicle.orientation == "H" else vehicle.col
-                new_row = vehicle.row - move_amount if vehicle.orientation == "V" else vehicle.row
-                
-                # Check if move is valid
-                if self._isValidMove(vehicle, new_row, new_col, temp_board):
-                    # Create new state
-                    new_puzzle = self._createSuccessorState(idx, new_row, new_col)
-                    direction = 'left' if vehicle.orientation == 'H' else 'up'
-                    action = f"Move {vehicle.vid} {direction} {move_amount}"
-                    successors.append((action, new_puzzle))
-                else:
-                    break  # Can't move further in this direction
-            
-            # Try moving right/down (positive direction)
-            for move_amount in range(1, self.board_width if vehicle.orientation == "H" else self.board_height):
-                new_col = vehicle.col + move_amount if vehicle.orientation == "H" else vehicle.col
-                new_row = vehicle.row + move_amount if vehicle.orientation == "V" else vehicle.row
-                
-                # Check if move is valid
-                if self._isValidMove(vehicle, new_row, new_col, temp_board):
-                    # Create new state
-                    new_puzzle = self._createSuccessorState(idx, new_row, new_col)
-                    direction = 'right' if vehicle.orientation == 'H' else 'down'
-                    action = f"Move {vehicle.vid} {direction} {move_amount}"
-                    successors.append((action, new_puzzle))
-                else:
-                    break  # Can't move further in this direction
-        
-        return successors
-
-    def _isValidMove(self, vehicle, new_row, new_col, board):
-        if vehicle.orientation == "H":
-            # Check horizontal bounds
-            if new_col < 0 or new_col + vehicle.length > self.board_width:
-                return False
-            
-            # Check for collisions along the new position
-            for i in range(vehicle.length):
-                cell_content = board[vehicle.row][new_col + i]
-                if cell_content not in [".", vehicle.vid]:
-                    return False
-        else:  # Vertical
-            # Check vertical bounds
-            if new_row < 0 or new_row + vehicle.length > self.board_height:
-                return False
-            
-            # Check for collisions along the new position
-            for i in range(vehicle.length):
-                cell_content = board[new_row + i][vehicle.col]
-                if cell_content not in [".", vehicle.vid]:
-                    return False
-        
-        return True
-
-    def _createSuccessorState(self, vehicle_idx, new_row, new_col):
-        new_puzzle = RushHourPuzzle()
-        new_puzzle.board_height = self.board_height
-        new_puzzle.board_width = self.board_width
-        new_puzzle.walls = self.walls.copy()
-        
-        # Copy all vehicles
-        new_puzzle.vehicles = []
-        for i, v in enumerate(self.vehicles):
-            if i == vehicle_idx:
-                # Create moved vehicle
-                new_vehicle = Vehicle(v.vid, new_col, new_row, v.orientation, v.length)
-                new_puzzle.vehicles.append(new_vehicle)
-            else:
-                # Copy original vehicle
-                new_vehicle = Vehicle(v.vid, v.col, v.row, v.orientation, v.length)
-                new_puzzle.vehicles.append(new_vehicle)
-        
-        # Regenerate board
-        new_puzzle.setBoard()
-        return new_puzzle
-
-    def __eq__(self, other):
-        if not isinstance(other, RushHourPuzzle):
-            return False
-        
-        # Check if vehicles are in the same positions
-        if len(self.vehicles) != len(other.vehicles):
-            return False
-        
-        for v1, v2 in zip(self.vehicles, other.vehicles):
-            if (v1.vid != v2.vid or v1.row != v2.row or v1.col != v2.col or 
-                v1.orientation != v2.orientation or v1.length != v2.length):
-                return False
-        
-        return True
-
-    def __hash__(self):
-        # Create a hash based on vehicle positions
-        vehicle_data = []
-        for v in sorted(self.vehicles, key=lambda x: x.vid):
-            vehicle_data.append((v.vid, v.row, v.col, v.orientation, v.length))
-        return hash(tuple(vehicle_data))
-
-
-class Node:
-    def __init__(self, state, parent=None, action=None, g=0, f=0):
-        self.state = state
-        self.parent = parent
-        self.action = action
-        self.g = g
-        self.f = f
-    
-    def getPath(self):
-        path = []
-        current = self
-        while current is not None:
-            path.append(current.state)
-            current = current.parent
-        path.reverse()
-        return path
-    
-    def getSolution(self):
-        actions = []
-        current = self
-        while current.parent is not None:
-            actions.append(current.action)
-            current = current.parent
-        actions.reverse()
-        return actions
-    
-    def __eq__(self, other):
-        if not isinstance(other, Node):
-            return False
-        return self.state == other.state
-    
-    def __hash__(self):
-        return hash(self.state)
-    
-    def __lt__(self, other):
-        # For priority queue comparison
-        return self.f < other.f
-
-
-def BFS(s, successorsFn, isGoal):
-    start_time = time.time()
-    
-    Open = deque()
-    Closed = set()
-    
-    init_node = Node(s, None, None)
-    
-    if isGoal(init_node.state):
-        end_time = time.time()
-        return init_node, end_time - start_time
-    
-    Open.append(init_node)
-    Closed = set()
-    
-    
-    while Open:
-        
-        current = Open.popleft()
-        
-        Closed.add(current.state)
-        
-        for action, successor in successorsFn(current.state):
-            child = Node(successor, current, action, 0)
-            
-            # First check if this child is the goal state
-            if isGoal(child.state):
-                end_time = time.time()
-                return child, end_time - start_time
-            
-            # Then check if we should add it to Open
-            if child.state not in Closed and not any(node.state == child.state for node in Open):
-                Open.append(child)
-    
-    end_time = time.time()
-    return None, end_time - start_time
-
-
-def AStar(s, successorsFn, isGoal, h):
-    start_time = time.time()
-    
-    Open = []
-    Closed = set()
-    
-    # Initialize the start node
-    init_node = Node(s, None, None)
-    init_node.g = 0
-    init_node.f = h(init_node)
-    
-    heapq.heappush(Open, (init_node.f, init_node))
-    
-    while Open:
-        # Get node with lowest f value
-        current_f, current = heapq.heappop(Open)
-        
-        # Skip if this state was already expanded
-        if current.state in Closed:
-            continue
-            
-        if isGoal(current.state):
-            end_time = time.time()
-            return current, end_time - start_time
-        
-        Closed.add(current.state)
-        
-        for action, successor in successorsFn(current.state):
-            child_state = successor
-            
-            # Skip if already expanded
-            if child_state in Closed:
-                continue
-                
-            child_g = current.g + 1
-            child_f = child_g + h(Node(child_state, None, None, child_g, 0))
-            
-            # Create child node and add to Open
-            child_node = Node(child_state, current, action, child_g, child_f)
-            heapq.heappush(Open, (child_f, child_node))
-    
-    end_time = time.time()
-    return None, end_time - start_time
-
-
-# Heuristic functions
-def h1(node):
-    state = node.state
-    red_car = None
-    
-    # Find the red car
-    for v in state.vehicles:
-        if v.vid == 'X':
-            red_car = v
-            break
-    
-    if not red_car or red_car.orientation != "H":
-        return float('inf')
-    
-    # Distance from the front of the red car to the right edge
-    distance = state.board_width - (red_car.col + red_car.length)
-    return distance
-
-def h2(node):
-    state = node.state
-    red_car = None
-    
-    # Find the red car
-    for v in state.vehicles:
-        if v.vid == 'X':
-            red_car = v
-            break
-    
-    if not red_car or red_car.orientation != "H":
-        return float('inf')
-    
-    # Calculate h1
-    h1_value = state.board_width - (red_car.col + red_car.length)
-    
-    # Count vehicles blocking the path
-    blocking_count = 0
-    red_car_row = red_car.row
-    red_car_front_col = red_car.col + red_car.length
-    
-    # Check each column from the red car's front to the exit
-    for col in range(red_car_front_col, state.board_width):
-        cell_content = state.board[red_car_row][col]
-        if cell_content != '.' and cell_content != 'X':
-            blocking_count += 1
-    
-    return h1_value + blocking_count
-
-def h3(node):
-    # take in considiration : The distance to exit like h1, The number of blocking vehicles like h2,The minimum number of moves needed to clear 
-   # each blocking vehicle
-    
-    state = node.state
-    red_car = None
-    
-    # Find the red car
-    for v in state.vehicles:
-        if v.vid == 'X':
-            red_car = v
-            break
-    
-    if not red_car or red_car.orientation != "H":
-        return float('inf')
-    
-    # Calculate h1
-    h1_value = state.board_width - (red_car.col + red_car.length)
-    
-    # Count vehicles blocking the path and estimate moves to clear them
-    total_blocking_cost = 0
-    red_car_row = red_car.row
-    red_car_front_col = red_car.col + red_car.length
-    
-    blocking_vehicles = set()
-    
-    # First pass: identify all blocking vehicles
-    for col in range(red_car_front_col, state.board_width):
-        cell_content = state.board[red_car_row][col]
-        if cell_content != '.' and cell_content != 'X' and cell_content not in blocking_vehicles:
-            blocking_vehicles.add(cell_content)
-    
-    # For each blocking vehicle, estimate minimum moves to clear it
-    for vid in blocking_vehicles:
-        blocking_vehicle = None
-        for v in state.vehicles:
-            if v.vid == vid:
-                blocking_vehicle = v
-                break
-        
-        if not blocking_vehicle:
-            continue
-            
-        if blocking_vehicle.orientation == "H":
-            # Horizontal vehicles can't be on the same row as red car and block it
-            # This shouldn't happen in valid states
-            total_blocking_cost += 2  # Conservative estimate
-        else:
-            # Vertical vehicle blocking the path
-            # Minimum moves to clear: need to move it up or down
-            # Check available space above and below
-            
-            space_above = 0
-            space_below = 0
-            
-            # Check space above
-            for r in range(blocking_vehicle.row - 1, -1, -1):
-                if state.board[r][blocking_vehicle.col] == '.':
-                    space_above += 1
-                else:
-                    break
-            
-            # Check space below  
-            for r in range(blocking_vehicle.row + blocking_vehicle.length, state.board_height):
-                if state.board[r][blocking_vehicle.col] == '.':
-                    space_below += 1
-                else:
-                    break
-            
-            # Minimum moves needed: at least 1 to move, plus potentially more if space is limited
-            min_moves = 1
-            if space_above == 0 and space_below == 0:
-                # Vehicle is completely blocked, will need multiple moves to clear
-                min_moves = 3  # Conservative estimate
-            elif space_above < blocking_vehicle.length and space_below < blocking_vehicle.length:
-                # Limited space in both directions
-                min_moves = 2
-            
-            total_blocking_cost += min_moves
-    
-    return h1_value + total_blocking_cost
-
-
-
 class PygameVisualizer:
     def __init__(self, puzzle):
+        loadPygame()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Rush Hour Puzzle Solver")
         self.clock = pygame.time.Clock()
@@ -914,45 +471,6 @@ class PygameVisualizer:
                 break
 
 
-def solve_with_all_algorithms(puzzle):
-    #solve the puzzle with all algorithms and return solutions with stats
-    solutions = {}
-    
-    print("Solving with BFS...")
-    bfs_solution, bfs_time = BFS(
-        puzzle, lambda state: state.successorFunction(), lambda state: state.isGoal()
-    )
-    
-    if bfs_solution:
-        solutions["BFS"] = {
-            "solution": bfs_solution,
-            "stats": {
-                "Execution Time": f"{bfs_time:.4f}s",
-                "Solution Cost": len(bfs_solution.getSolution())
-            }
-        }
-    
-    # Test A* with different heuristics
-    heuristics = [("A* (h1)", h1), ("A* (h2)", h2), ("A* (h3)", h3)]
-    
-    for h_name, h_func in heuristics:
-        print(f"Solving with {h_name}...")
-        a_star_solution, a_star_time = AStar(
-            puzzle, lambda state: state.successorFunction(), lambda state: state.isGoal(), h_func
-        )
-        
-        if a_star_solution:
-            solutions[h_name] = {
-                "solution": a_star_solution,
-                "stats": {
-                    "Execution Time": f"{a_star_time:.4f}s",
-                    "Solution Cost": len(a_star_solution.getSolution())
-                }
-            }
-    
-    return solutions
-
-
 def main():
     # Load puzzle
     puzzle = RushHourPuzzle()
@@ -967,7 +485,7 @@ def main():
     
     # Solve with all algorithms
     print("Solving puzzle with all algorithms...")
-    solutions = solve_with_all_algorithms(puzzle)
+    solutions = solve_with_all_algorithms(puzzle, parallel=True, algorithms=VISUALIZER_ALGORITHMS)
     
     if not solutions:
         print("No solutions found!")
@@ -0,0 +1,41 @@
+# Rush Hour solver core: puzzle model, search algorithms and heuristics.
+# Importing it never loads pygame; the visualizers in rushhour.py and
+# rushhourbinome.py load it only when an animation is shown.
+#
+# Import policy: modules import what they need at the top, including what
+# nearly every use needs anyway (csv to load a puzzle, hashlib for its
+# Zobrist keys). The exceptions are dependencies that only some algorithms
+# use and that benchmarks/import_time.py shows would weigh on the cold
+# import; they are imported inside the function that needs them:
+# multiprocessing (about 12 ms, 20 ms with its shared memory), tempfile
+# (about 7 ms) and numpy (about 100 ms, and optional).
+from .puzzle import Vehicle, RushHourPuzzle, zobristKey
+from .bitboard import BoardInfo, BitboardState
+from .move import Move
+from .node import Node, NodeTable, TableNode
+from .stats import SearchStats
+from .search import BFS, AStar, BidirectionalBFS, DiskFrontierBFS, ExternalBFS, IDAStar
+from .parallel import ParallelBFS
+from .heuristics import h1, h2, h3, h4
+from .pdb import PatternDatabase
+from .cache import SolutionCache
+from .solve import ALGORITHMS, OPTIMAL_ALGORITHMS, solve_with_all_algorithms, solve_portfolio
+
+__all__ = [
+    "Vehicle", "RushHourPuzzle", "zobristKey",
+    "BoardInfo", "BitboardState", "Move",
+    "Node", "NodeTable", "TableNode", "SearchStats",
+    "BFS", "AStar", "BidirectionalBFS", "DiskFrontierBFS", "ExternalBFS", "IDAStar", "ParallelBFS",
+    "h1", "h2", "h3", "h4", "PatternDatabase",
+    "StateSpace", "SolutionCache",
+    "ALGORITHMS", "OPTIMAL_ALGORITHMS", "solve_with_all_algorithms", "solve_portfolio",
+]
+
+
+def __getattr__(name):
+    # StateSpace lives in a module that is also run as a script
+    # (python -m solver.statespace); importing it lazily avoids loading it twice
+    if name == "StateSpace":
+        from .statespace import StateSpace
+        return StateSpace
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
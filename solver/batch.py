@@ -0,0 +1,124 @@
+# Headless batch solver: fans puzzle files out over a process pool and streams
+# one JSON object per (puzzle, algorithm) to stdout as soon as it is solved.
+#
+#   python -m solver.batch PUZZLES... [--workers N] [--timeout SECONDS]
+#                          [--algorithms "BFS" "A* (h2)"] [--bitboard] [--sample N]
+#
+# PUZZLES may be CSV files, directories (every *.csv inside) or glob patterns.
+# Each object also carries the search statistics (see SearchStats.asDict);
+# timers are sampled on one expansion out of N.
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+from .puzzle import RushHourPuzzle
+from .solve import ALGORITHMS, STATS_SAMPLE, runAlgorithm
+
+
+class SolveTimeout(Exception):
+    pass
+
+
+def _onAlarm(signum, frame):
+    raise SolveTimeout()
+
+
+def findPuzzles(patterns):
+    # Expand files, directories and glob patterns into a sorted, de-duplicated list
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.update(glob.glob(os.path.join(pattern, "*.csv")))
+        elif os.path.isfile(pattern):
+            files.add(pattern)
+        else:
+            files.update(glob.glob(pattern, recursive=True))
+    return sorted(files)
+
+
+def solveTask(task):
+    # Runs in a worker process: solve one puzzle with one algorithm
+    filename, algorithm, timeout, bitboard, sample = task
+    result = {"puzzle": filename, "algorithm": algorithm,
+              "cost": None, "expanded": None, "time": None, "status": "solved"}
+
+    # SIGALRM interrupts the search where the platform supports it (POSIX)
+    use_alarm = timeout and hasattr(signal, "SIGALRM")
+    start = time.perf_counter()
+    try:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(filename)
+        puzzle.setBoard()
+        if bitboard:
+            puzzle = puzzle.toBitboard()
+
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _onAlarm)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            solution, elapsed, stats = runAlgorithm(algorithm, puzzle, sample)
+        finally:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+
+        search = stats.asDict()
+        del search["elapsed"]  # reported as "time"
+        result.update(search)
+        result["time"] = round(elapsed, 6)
+        if solution is None:
+            result["status"] = "unsolvable"
+        else:
+            result["cost"] = len(solution.getSolution())
+    except SolveTimeout:
+        result["status"] = "timeout"
+        result["time"] = round(time.perf_counter() - start, 6)
+    except Exception as exc:  # report the failure and keep the batch going
+        result["status"] = "error"
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    return result
+
+
+def runBatch(files, algorithms, workers=None, timeout=None, bitboard=False, out=sys.stdout,
+             sample=STATS_SAMPLE):
+    tasks = [(filename, algorithm, timeout, bitboard, sample)
+             for filename in files for algorithm in algorithms]
+    if not tasks:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+        for result in pool.imap_unordered(solveTask, tasks):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    return len(tasks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many Rush Hour puzzles in parallel")
+    parser.add_argument("puzzles", nargs="+", help="CSV files, directories or glob patterns")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: every CPU core)")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="seconds allowed per puzzle and algorithm")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS), metavar="NAME",
+                        help=f"algorithms to run (default: all of {', '.join(ALGORITHMS)})")
+    parser.add_argument("--bitboard", action="store_true",
+                        help="search over BitboardState (recommended for large boards)")
+    parser.add_argument("--sample", type=int, default=STATS_SAMPLE,
+                        help=f"time one expansion out of N (default: {STATS_SAMPLE}; 1 times all of them)")
+    args = parser.parse_args(argv)
+
+    files = findPuzzles(args.puzzles)
+    if not files:
+        parser.error("no puzzle files found")
+    runBatch(files, args.algorithms, args.workers, args.timeout, args.bitboard, sample=args.sample)
+
+
+if __name__ == "__main__":
+    main()
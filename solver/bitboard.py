@@ -0,0 +1,321 @@
+from .heuristics import HeuristicCache
+from .move import moveTable
+from .puzzle import Vehicle, RushHourPuzzle
+
+
+class BoardInfo:
+    # Fixed data shared by every bitboard state of one puzzle: dimensions, walls,
+    # orientation and length of each vehicle, and the cell masks for every position
+    def __init__(self, puzzle):
+        self.board_height = puzzle.board_height
+        self.board_width = puzzle.board_width
+        self.walls = list(puzzle.walls)
+
+        self.vids = [v.vid for v in puzzle.vehicles]
+        self.orientations = [v.orientation for v in puzzle.vehicles]
+        self.lengths = [v.length for v in puzzle.vehicles]
+        # Row of a horizontal vehicle / column of a vertical one never changes
+        self.lines = [v.row if v.orientation == "H" else v.col for v in puzzle.vehicles]
+        self.x_index = self.vids.index("X") if "X" in self.vids else None
+
+        # Cell (r, c) is bit r * board_width + c
+        self.wall_mask = 0
+        for (r, c) in self.walls:
+            self.wall_mask |= self.cellBit(r, c)
+
+        # masks[i][p] = cells covered by vehicle i when its free coordinate is p
+        self.masks = []
+        for i in range(len(self.vids)):
+            limit = self.board_width if self.orientations[i] == "H" else self.board_height
+            self.masks.append([self._vehicleMask(i, p) for p in range(limit - self.lengths[i] + 1)])
+
+        # The same cells column-major, cell (r, c) being bit c * board_height + r,
+        # so that a column is as easy to read as a row
+        self.column_wall_mask = 0
+        for (r, c) in self.walls:
+            self.column_wall_mask |= self.columnCellBit(r, c)
+        self.column_masks = []
+        for i in range(len(self.vids)):
+            self.column_masks.append([self._vehicleMask(i, p, self.columnCellBit)
+                                      for p in range(len(self.masks[i]))])
+
+        # Each vehicle moves along one row (horizontal) of the row-major occupancy
+        # or one column (vertical) of the column-major one: where that line starts
+        # and how many cells it has
+        self.line_shifts = []
+        self.line_sizes = []
+        for i in range(len(self.vids)):
+            if self.orientations[i] == "H":
+                self.line_shifts.append(self.lines[i] * self.board_width)
+                self.line_sizes.append(self.board_width)
+            else:
+                self.line_shifts.append(self.lines[i] * self.board_height)
+                self.line_sizes.append(self.board_height)
+        self.line_full = [(1 << size) - 1 for size in self.line_sizes]
+
+        # Each vehicle's free coordinate is packed into the layout integer
+        self.pos_bits = max(self.board_width, self.board_height).bit_length()
+        self.pos_mask = (1 << self.pos_bits) - 1
+        self.shifts = [i * self.pos_bits for i in range(len(self.vids))]
+        self.layout_bytes = (len(self.vids) * self.pos_bits + 7) // 8
+
+        # Shared Move objects: moves[i] = (left/up by d, right/down by d)
+        self.moves = moveTable(self.vids, self.orientations, self.board_height, self.board_width)
+        # Per-board data of the heuristics (see heuristics.HeuristicCache),
+        # shared with the puzzle so values memoized on either kind of state
+        # serve both
+        if puzzle.heuristic_cache is None:
+            puzzle.heuristic_cache = HeuristicCache(self.vids, self.board_height, self.board_width)
+        self.heuristic_cache = puzzle.heuristic_cache
+
+    def __getstate__(self):
+        # The heuristic memo stays in this process (see HeuristicCache)
+        state = self.__dict__.copy()
+        state["heuristic_cache"] = None
+        return state
+
+    def cellBit(self, row, col):
+        return 1 << (row * self.board_width + col)
+
+    def columnCellBit(self, row, col):
+        return 1 << (col * self.board_height + row)
+
+    def _vehicleMask(self, idx, pos, cellBit=None):
+        cellBit = cellBit or self.cellBit
+        mask = 0
+        for i in range(self.lengths[idx]):
+            if self.orientations[idx] == "H":
+                mask |= cellBit(self.lines[idx], pos + i)
+            else:
+                mask |= cellBit(pos + i, self.lines[idx])
+        return mask
+
+    def segment(self, idx, pos):
+        # Range of positions vehicle idx can ever reach from pos: walls on its line
+        # cannot be crossed
+        masks = self.masks[idx]
+        low = pos
+        while low > 0 and not masks[low - 1] & self.wall_mask:
+            low -= 1
+        high = pos
+        while high < len(masks) - 1 and not masks[high + 1] & self.wall_mask:
+            high += 1
+        return low, high
+
+    def goalLayouts(self, layout, limit=None):
+        # Every layout with X at the exit that keeps the invariants of `layout`:
+        # each vehicle stays on its line between the same walls, vehicles sharing
+        # a line keep their order, and nothing overlaps.
+        # limit: give up (return None) past that many goals, or past four times
+        # that many placements tried, since the count grows exponentially with
+        # the free space of the board
+        x = self.x_index
+        if x is None or self.orientations[x] != "H":
+            return []
+        positions = [(layout >> shift) & self.pos_mask for shift in self.shifts]
+        bounds = [self.segment(i, p) for i, p in enumerate(positions)]
+
+        goal_pos = self.board_width - self.lengths[x]
+        if not bounds[x][0] <= goal_pos <= bounds[x][1]:
+            return []
+
+        # Neighbours along a shared line, in their current order
+        previous = [None] * len(positions)
+        following = [None] * len(positions)
+        lines = {}
+        for i in range(len(positions)):
+            lines.setdefault((self.orientations[i], self.lines[i]), []).append(i)
+        for members in lines.values():
+            members.sort(key=lambda i: positions[i])
+            for a, b in zip(members, members[1:]):
+                previous[b] = a
+                following[a] = b
+
+        order = [x] + [i for i in range(len(positions)) if i != x]
+        placed = [None] * len(positions)
+        goals = []
+        budget = [None if limit is None else 4 * limit]
+
+        def place(k, occupied, packed):
+            # False once the limit is passed
+            if budget[0] is not None:
+                budget[0] -= 1
+                if budget[0] < 0:
+                    return False
+            if k == len(order):
+                goals.append(packed)
+                return limit is None or len(goals) <= limit
+            i = order[k]
+            low, high = bounds[i]
+            if i == x:
+                low = high = goal_pos
+            for pos in range(low, high + 1):
+                mask = self.masks[i][pos]
+                if occupied & mask:
+                    continue
+                p, f = previous[i], following[i]
+                if p is not None and placed[p] is not None and pos < placed[p] + self.lengths[p]:
+                    continue
+                if f is not None and placed[f] is not None and pos + self.lengths[i] > placed[f]:
+                    continue
+                placed[i] = pos
+                complete = place(k + 1, occupied | mask, packed | (pos << self.shifts[i]))
+                placed[i] = None
+                if not complete:
+                    return False
+            return True
+
+        if not place(0, self.wall_mask, 0):
+            return None
+        return goals
+
+    def occupancy(self, layout):
+        occupied = self.wall_mask
+        for i, shift in enumerate(self.shifts):
+            occupied |= self.masks[i][(layout >> shift) & self.pos_mask]
+        return occupied
+
+    def columnOccupancy(self, layout):
+        occupied = self.column_wall_mask
+        for i, shift in enumerate(self.shifts):
+            occupied |= self.column_masks[i][(layout >> shift) & self.pos_mask]
+        return occupied
+
+
+class BitboardState:
+    # Search state storing only integers: the packed vehicle positions (layout)
+    # and the occupancy of vehicles plus walls, row-major (occupied) and
+    # column-major (columns). Any board size works: Python integers are
+    # arbitrary-width bitsets
+    __slots__ = ("info", "layout", "occupied", "columns")
+
+    def __init__(self, info, layout, occupied=None, columns=None):
+        self.info = info
+        self.layout = layout
+        self.occupied = info.occupancy(layout) if occupied is None else occupied
+        self.columns = info.columnOccupancy(layout) if columns is None else columns
+
+    def position(self, idx):
+        return (self.layout >> self.info.shifts[idx]) & self.info.pos_mask
+
+    def isGoal(self):
+        info = self.info
+        x = info.x_index
+        if x is None or info.orientations[x] != "H":
+            return False
+        return self.position(x) + info.lengths[x] == info.board_width
+
+    def successorFunction(self):
+        successors = []
+        info = self.info
+        layout, occupied, columns = self.layout, self.occupied, self.columns
+        pos_mask = info.pos_mask
+
+        for idx, masks in enumerate(info.masks):
+            shift = info.shifts[idx]
+            pos = (layout >> shift) & pos_mask
+            length = info.lengths[idx]
+            horizontal = info.orientations[idx] == "H"
+
+            # The vehicle's row (or column) as a small bitset; the free run on
+            # each side ends at the nearest occupied cell
+            line = ((occupied if horizontal else columns) >> info.line_shifts[idx]) & info.line_full[idx]
+            back_run = pos - (line & ((1 << pos) - 1)).bit_length()
+            ahead = line >> (pos + length)
+            if ahead:
+                front_run = (ahead & -ahead).bit_length() - 1
+            else:
+                front_run = info.line_sizes[idx] - pos - length
+            if not back_run and not front_run:
+                continue
+
+            column_masks = info.column_masks[idx]
+            # Occupancy without the vehicle; each child adds its new cells back
+            occupied_off = occupied ^ masks[pos]
+            columns_off = columns ^ column_masks[pos]
+            back, ahead = info.moves[idx]
+
+            # Try moving left/up (negative direction)
+            for distance in range(1, back_run + 1):
+                new_pos = pos - distance
+                child = BitboardState(info, layout - (distance << shift),
+                                      occupied_off | masks[new_pos], columns_off | column_masks[new_pos])
+                successors.append((back[distance], child))
+
+            # Try moving right/down (positive direction)
+            for distance in range(1, front_run + 1):
+                new_pos = pos + distance
+                child = BitboardState(info, layout + (distance << shift),
+                                      occupied_off | masks[new_pos], columns_off | column_masks[new_pos])
+                successors.append((ahead[distance], child))
+
+        return successors
+
+    def toPuzzle(self):
+        puzzle = RushHourPuzzle()
+        puzzle.board_height = self.info.board_height
+        puzzle.board_width = self.info.board_width
+        puzzle.walls = self.info.walls.copy()
+        puzzle.vehicles = self.vehicles
+        puzzle.setBoard()
+        return puzzle
+
+    # Read-only views so heuristics and the visualizers can use bitboard states
+    # the same way as RushHourPuzzle
+    @property
+    def heuristic_cache(self):
+        return self.info.heuristic_cache
+
+    @heuristic_cache.setter
+    def heuristic_cache(self, value):
+        self.info.heuristic_cache = value
+
+    @property
+    def board_height(self):
+        return self.info.board_height
+
+    @property
+    def board_width(self):
+        return self.info.board_width
+
+    @property
+    def walls(self):
+        return self.info.walls
+
+    @property
+    def vehicles(self):
+        info = self.info
+        vehicles = []
+        for i, vid in enumerate(info.vids):
+            pos = self.position(i)
+            if info.orientations[i] == "H":
+                vehicles.append(Vehicle(vid, pos, info.lines[i], "H", info.lengths[i]))
+            else:
+                vehicles.append(Vehicle(vid, info.lines[i], pos, "V", info.lengths[i]))
+        return vehicles
+
+    @property
+    def board(self):
+        board = [["." for _ in range(self.board_width)] for _ in range(self.board_height)]
+        for v in self.vehicles:
+            for i in range(v.length):
+                if v.orientation == "H":
+                    board[v.row][v.col + i] = v.vid
+                else:
+                    board[v.row + i][v.col] = v.vid
+        for (r, c) in self.walls:
+            board[r][c] = "#"
+        return board
+
+    def display(self):
+        for row in self.board:
+            print(" ".join(row))
+        print()
+
+    def __eq__(self, other):
+        if not isinstance(other, BitboardState):
+            return False
+        return self.layout == other.layout
+
+    def __hash__(self):
+        return hash(self.layout)
@@ -0,0 +1,151 @@
+import json
+import os
+from collections import OrderedDict
+
+from .cachefiles import defaultCacheDir, writeAtomic
+from .puzzle import zobristKey
+
+# Share of disk_entries that a disk eviction leaves, so the directory is not
+# scanned again on the very next put
+EVICT_TO = 0.9
+
+
+def canonicalVehicles(puzzle):
+    # X first, then the other vehicles in board order: labels do not matter,
+    # and no two vehicles share their top-left cell, so the order is unique
+    vehicles = sorted(puzzle.vehicles, key=lambda v: (v.vid != "X", v.row, v.col, v.orientation, v.length))
+    if not vehicles or vehicles[0].vid != "X":
+        vehicles.insert(0, None)
+    return vehicles
+
+
+def fingerprint(puzzle, vehicles=None):
+    # Same value for every puzzle with the same dimensions, walls and vehicle
+    # layout, whatever the vehicles are called
+    if vehicles is None:
+        vehicles = canonicalVehicles(puzzle)
+    layout = tuple(None if v is None else (v.orientation, v.length, v.row, v.col) for v in vehicles)
+    key = zobristKey(puzzle.board_height, puzzle.board_width, tuple(sorted(puzzle.walls)), layout)
+    return f"{key:016x}"
+
+
+class SolutionCache:
+    # Optimal move lists by puzzle fingerprint, in two LRU tiers: up to
+    # memory_entries in this process and up to disk_entries JSON files in
+    # cache_dir (least recently used evicted first; cache_dir=False keeps it in
+    # memory only). Moves are stored with canonical vehicle numbers and renamed
+    # to the caller's labels on the way out. The number of files on disk is
+    # counted once and then kept up to date, so the directory is only scanned
+    # when that count passes disk_entries.
+    def __init__(self, cache_dir=None, memory_entries=1024, disk_entries=100000):
+        self.cache_dir = defaultCacheDir("solutions") if cache_dir is None else cache_dir
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.memory = OrderedDict()
+        self.disk_count = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, puzzle):
+        # Cached solution of puzzle as action strings, or None
+        vehicles = canonicalVehicles(puzzle)
+        key = fingerprint(puzzle, vehicles)
+
+        moves = self.memory.get(key)
+        if moves is not None:
+            self.memory.move_to_end(key)
+            self.hits += 1
+        elif self.cache_dir:
+            try:
+                with open(self._path(key)) as f:
+                    moves = json.load(f)
+                os.utime(self._path(key))
+            except (OSError, ValueError):
+                moves = None
+            if moves is not None:
+                self.disk_hits += 1
+                self._remember(key, moves)
+
+        if moves is None:
+            self.misses += 1
+            return None
+        return [f"Move {vehicles[k].vid} {direction} {distance}" for k, direction, distance in moves]
+
+    def put(self, puzzle, actions):
+        # Store an optimal solution of puzzle (action strings "Move <vid> <direction> <n>")
+        vehicles = canonicalVehicles(puzzle)
+        key = fingerprint(puzzle, vehicles)
+        number = {v.vid: k for k, v in enumerate(vehicles) if v is not None}
+        moves = []
+        for action in actions:
+            _, vid, direction, distance = action.split()
+            moves.append((number[vid], direction, int(distance)))
+
+        self._remember(key, moves)
+        if self.cache_dir:
+            path = self._path(key)
+            if self.disk_count is None:
+                self.disk_count = len(self._diskEntries())
+            if not os.path.exists(path):
+                self.disk_count += 1
+            writeAtomic(path, json.dumps(moves).encode())
+            if self.disk_count > self.disk_entries:
+                self._evictDisk()
+
+    def _remember(self, key, moves):
+        self.memory[key] = moves
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def _diskEntries(self):
+        try:
+            return [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith(".json")]
+        except FileNotFoundError:
+            return []
+
+    def _evictDisk(self):
+        # Least recently used files first, down to EVICT_TO of disk_entries;
+        # the count is refreshed too, since other processes may share the directory
+        entries = self._diskEntries()
+        keep = int(self.disk_entries * EVICT_TO)
+        self.disk_count = len(entries)
+        if len(entries) <= keep:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - keep]:
+            try:
+                os.remove(entry.path)
+                self.disk_count -= 1
+            except OSError:
+                pass
+
+    def solve(self, puzzle, algorithm="BFS"):
+        # Cached solution, or solve with an optimal algorithm and remember it.
+        # Returns the action strings (None if the puzzle has no solution)
+        from .solve import ALGORITHMS, OPTIMAL_ALGORITHMS, successors
+
+        if algorithm not in OPTIMAL_ALGORITHMS:
+            raise ValueError(f"{algorithm} does not guarantee an optimal solution")
+        actions = self.get(puzzle)
+        if actions is None:
+            solution, _ = ALGORITHMS[algorithm](puzzle, successors)
+            if solution is None:
+                return None
+            actions = solution.getSolution()
+            self.put(puzzle, actions)
+        return actions
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk hits": self.disk_hits,
+            "misses": self.misses,
+            "hit rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory entries": len(self.memory),
+        }
@@ -0,0 +1,63 @@
+# Files of the solver's on-disk caches: solutions, pattern database tables and
+# state space indexes, each kind in its own directory under
+# ~/.cache/rushhour (or $XDG_CACHE_HOME/rushhour). Deleting that directory
+# clears them all; everything in it is rebuilt on demand
+import os
+
+# Default size limit of the pattern database and state space directories
+CACHE_BYTES = 512 * 1024 * 1024
+
+
+def defaultCacheDir(kind):
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "rushhour", kind)
+
+
+def touch(path):
+    # Mark a cached file as just used, for evictFiles
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def evictFiles(directory, suffix, max_bytes, keep=None):
+    # Delete the least recently used (oldest modification time) files ending in
+    # suffix until the rest take at most max_bytes; keep is a path never
+    # deleted. Files mapped by another process stay readable there until it
+    # closes them (on Windows they cannot be deleted and are skipped)
+    try:
+        entries = [entry for entry in os.scandir(directory) if entry.name.endswith(suffix)]
+    except FileNotFoundError:
+        return
+    stats = {entry.path: entry.stat() for entry in entries}
+    total = sum(stat.st_size for stat in stats.values())
+    for path in sorted(stats, key=lambda path: stats[path].st_mtime):
+        if total <= max_bytes:
+            break
+        if keep is not None and os.path.samefile(path, keep):
+            continue
+        try:
+            os.remove(path)
+            total -= stats[path].st_size
+        except OSError:
+            pass
+
+
+def writeAtomic(path, *chunks):
+    # Write the bytes-like chunks to path, creating its directory. They go to a
+    # private file first and are renamed into place, so concurrent readers and
+    # writers never see half a file
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,195 @@
+# FIFO queue of packed layouts that holds at most a fixed number of them in
+# memory and spills the rest to temporary files, for breadth-first searches
+# whose frontier would not fit in RAM.
+from collections import deque
+
+
+class DiskQueue:
+    # Layouts (non-negative integers of at most record_size bytes) in FIFO
+    # order: an in-memory head being consumed, chunks of memory_items // 2
+    # layouts on disk, and an in-memory tail being filled. At most memory_items
+    # layouts are kept in memory at any time.
+    def __init__(self, record_size, memory_items=1 << 20, directory=None):
+        self.record_size = record_size
+        self.chunk_items = max(1, memory_items // 2)
+        self.directory = directory
+        self.head = deque()
+        self.chunks = deque()
+        self.tail = []
+        self.on_disk = 0
+        self.spilled = 0
+        self.peak_memory = 0
+
+    def __len__(self):
+        return len(self.head) + self.on_disk + len(self.tail)
+
+    def append(self, layout):
+        self.tail.append(layout)
+        if len(self.tail) >= self.chunk_items:
+            self._spill()
+        size = len(self.head) + len(self.tail)
+        if size > self.peak_memory:
+            self.peak_memory = size
+
+    def popleft(self):
+        if not self.head:
+            if self.chunks:
+                self._load()
+            elif self.tail:
+                # Nothing on disk: the tail is next in line
+                self.head = deque(self.tail)
+                self.tail = []
+            else:
+                raise IndexError("pop from an empty DiskQueue")
+        return self.head.popleft()
+
+    def _spill(self):
+        size = self.record_size
+        import tempfile
+
+        f = tempfile.TemporaryFile(dir=self.directory)
+        f.write(b"".join(layout.to_bytes(size, "little") for layout in self.tail))
+        self.chunks.append((f, len(self.tail)))
+        self.on_disk += len(self.tail)
+        self.spilled += len(self.tail)
+        self.tail = []
+
+    def _load(self):
+        f, count = self.chunks.popleft()
+        size = self.record_size
+        with f:
+            f.seek(0)
+            data = f.read()
+        from_bytes = int.from_bytes
+        self.head = deque(from_bytes(data[i:i + size], "little") for i in range(0, len(data), size))
+        self.on_disk -= count
+
+    def close(self):
+        # Delete whatever is still on disk
+        while self.chunks:
+            self.chunks.popleft()[0].close()
+        self.on_disk = 0
+        self.head.clear()
+        self.tail = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def layoutsPerBudget(info, memory_budget):
+    # How many frontier layouts fit in memory_budget bytes: an int object of
+    # the layout's size plus its pointer in the list or deque
+    layout = (1 << (len(info.vids) * info.pos_bits)) - 1
+    return max(2, memory_budget // (layout.__sizeof__() + 8))
+
+
+# Bytes read at a time from each sorted layer or run file
+READ_BLOCK = 1 << 16
+
+
+def writeSorted(path, layouts, record_size):
+    # Write the distinct layouts in ascending order as big-endian records (so
+    # the byte order of the file is the numeric order). Returns how many
+    with open(path, "wb") as f:
+        previous = None
+        count = 0
+        batch = []
+        for layout in layouts:
+            if layout == previous:
+                continue
+            previous = layout
+            batch.append(layout.to_bytes(record_size, "big"))
+            count += 1
+            if len(batch) >= 4096:
+                f.write(b"".join(batch))
+                batch = []
+        f.write(b"".join(batch))
+    return count
+
+
+def readSorted(path, record_size):
+    # Layouts of a file written by writeSorted, in order, one block at a time
+    block = READ_BLOCK - READ_BLOCK % record_size
+    from_bytes = int.from_bytes
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(block)
+            if not data:
+                return
+            for i in range(0, len(data), record_size):
+                yield from_bytes(data[i:i + record_size], "big")
+
+
+def subtractSorted(layouts, *excluded):
+    # The ascending stream layouts without the values of the ascending streams
+    # in excluded (a merge, never holding more than one value of each)
+    excluded = [iter(stream) for stream in excluded]
+    heads = [next(stream, None) for stream in excluded]
+    for layout in layouts:
+        found = False
+        for i, stream in enumerate(excluded):
+            head = heads[i]
+            while head is not None and head < layout:
+                head = next(stream, None)
+            heads[i] = head
+            if head == layout:
+                found = True
+        if not found:
+            yield layout
+
+
+class BucketQueue:
+    # Open list for small non-negative integer priorities f: one bucket per f
+    # value instead of a binary heap, so a push is O(1) and a pop only moves
+    # the lowest non-empty f forward. Within a bucket, tie_break="lifo" pops
+    # the newest entry; tie_break="h" pops the entry with the lowest h (the
+    # deepest one) first, newest among equals, which scans at most f + 1
+    # sub-buckets
+    def __init__(self, tie_break="lifo"):
+        if tie_break not in ("lifo", "h"):
+            raise ValueError(f"unknown tie_break {tie_break!r}")
+        self.by_h = tie_break == "h"
+        # buckets[f] is a stack, or with tie_break="h" a list of stacks by h
+        self.buckets = []
+        self.counts = []
+        self.min_f = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, f, h, item):
+        buckets = self.buckets
+        while len(buckets) <= f:
+            buckets.append([])
+            self.counts.append(0)
+        bucket = buckets[f]
+        if self.by_h:
+            while len(bucket) <= h:
+                bucket.append([])
+            bucket = bucket[h]
+        bucket.append(item)
+        self.counts[f] += 1
+        self.size += 1
+        # Inconsistent heuristics can push below the current minimum
+        if f < self.min_f:
+            self.min_f = f
+
+    def pop(self):
+        # (f, item) with the lowest f
+        if not self.size:
+            raise IndexError("pop from an empty BucketQueue")
+        counts = self.counts
+        f = self.min_f
+        while not counts[f]:
+            f += 1
+        self.min_f = f
+        counts[f] -= 1
+        self.size -= 1
+        bucket = self.buckets[f]
+        if self.by_h:
+            bucket = next(stack for stack in bucket if stack)
+        return f, bucket.pop()
@@ -0,0 +1,172 @@
+# Random puzzle generator: writes hard puzzles as CSV files in the setVehicles
+# format, for benchmarking and for testing larger boards.
+#
+#   python -m solver.generator OUTDIR [--count 10] [--size 6x6] [--vehicles 12]
+#                              [--truck-ratio 0.25] [--walls 0] [--min-moves 20]
+#                              [--attempts 200] [--max-states 200000] [--seed N]
+#
+# Each attempt places X in the left half of the exit row and the other vehicles
+# (and walls) at random. If the reachable state space has at most --max-states layouts, the
+# position in it farthest from the goal is used instead (its exact distance is
+# known from a retrograde BFS); otherwise the random placement is solved by BFS
+# within the same budget. The --count longest puzzles of at least --min-moves
+# moves are kept.
+import argparse
+import itertools
+import os
+import random
+import string
+
+from .bitboard import BoardInfo, BitboardState
+from .puzzle import RushHourPuzzle, Vehicle
+from .search import BFS
+from .statespace import goalDistances
+
+
+class SearchLimit(Exception):
+    pass
+
+
+def vehicleIds(count):
+    # X is the red car; the others are A, B, ... then AA, AB, ...
+    letters = [c for c in string.ascii_uppercase if c != "X"]
+    ids = []
+    for size in itertools.count(1):
+        for combo in itertools.product(letters, repeat=size):
+            if len(ids) == count:
+                return ids
+            ids.append("".join(combo))
+
+
+def randomPuzzle(rng, height, width, vehicles, truck_ratio=0.25, walls=0, tries=1000):
+    # X (length 2) in the left half of the exit row, then up to `vehicles` more
+    # vehicles and `walls` walls on free cells
+    puzzle = RushHourPuzzle()
+    puzzle.board_height, puzzle.board_width = height, width
+    occupied = set()
+
+    row = (height - 1) // 2
+    col = rng.randrange(0, max(1, (width - 2) // 2))
+    puzzle.vehicles.append(Vehicle("X", col, row, "H", 2))
+    occupied.update({(row, col), (row, col + 1)})
+
+    ids = iter(vehicleIds(vehicles))
+    placed = 0
+    for _ in range(tries):
+        if placed == vehicles:
+            break
+        length = 3 if rng.random() < truck_ratio else 2
+        if rng.random() < 0.5:
+            r, c = rng.randrange(height), rng.randrange(width - length + 1)
+            # A horizontal vehicle in front of X could never get out of its way
+            if r == row and c > col:
+                continue
+            cells = [(r, c + i) for i in range(length)]
+            orientation = "H"
+        else:
+            r, c = rng.randrange(height - length + 1), rng.randrange(width)
+            cells = [(r + i, c) for i in range(length)]
+            orientation = "V"
+        if occupied.intersection(cells):
+            continue
+        occupied.update(cells)
+        puzzle.vehicles.append(Vehicle(next(ids), c, r, orientation, length))
+        placed += 1
+
+    for _ in range(tries):
+        if len(puzzle.walls) == walls:
+            break
+        cell = (rng.randrange(height), rng.randrange(width))
+        # Keep X's way to the exit free of walls
+        if cell in occupied or (cell[0] == row and cell[1] > col):
+            continue
+        occupied.add(cell)
+        puzzle.walls.append(cell)
+
+    puzzle.setBoard()
+    return puzzle
+
+
+def hardestPosition(puzzle, max_states=200000):
+    # (optimal number of moves, puzzle) for the hardest position found from
+    # puzzle, or None if it is unsolvable or too big to decide within max_states
+    info = BoardInfo(puzzle)
+    start = puzzle.toBitboard(info)
+
+    component = goalDistances(info, start.layout, max_states)
+    if component is not None:
+        _, distance = component
+        if not distance:
+            return None
+        layout, moves = max(distance.items(), key=lambda item: item[1])
+        return moves, BitboardState(info, layout).toPuzzle()
+
+    # Too many states to enumerate: solve the random placement itself
+    expanded = 0
+
+    def limitedSuccessors(state):
+        nonlocal expanded
+        expanded += 1
+        if expanded > max_states:
+            raise SearchLimit()
+        return state.successorFunction()
+
+    try:
+        solution, _ = BFS(start, limitedSuccessors, lambda state: state.isGoal())
+    except SearchLimit:
+        return None
+    if solution is None:
+        return None
+    return len(solution.getSolution()), puzzle
+
+
+def generate(count, height=6, width=6, vehicles=12, truck_ratio=0.25, walls=0,
+             min_moves=0, attempts=200, max_states=200000, seed=None):
+    # The `count` hardest puzzles out of `attempts` random ones, as
+    # (optimal moves, puzzle) pairs, hardest first
+    rng = random.Random(seed)
+    found = []
+    for _ in range(attempts):
+        puzzle = randomPuzzle(rng, height, width, vehicles, truck_ratio, walls)
+        result = hardestPosition(puzzle, max_states)
+        if result is not None and result[0] >= min_moves:
+            found.append(result)
+    found.sort(key=lambda item: -item[0])
+    return found[:count]
+
+
+def parseSize(text):
+    height, _, width = text.lower().partition("x")
+    return int(height), int(width or height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate hard Rush Hour puzzles")
+    parser.add_argument("outdir", help="directory for the CSV files")
+    parser.add_argument("--count", type=int, default=10, help="puzzles to keep")
+    parser.add_argument("--size", type=parseSize, default=(6, 6), help="HEIGHTxWIDTH (default 6x6)")
+    parser.add_argument("--vehicles", type=int, default=12, help="vehicles besides X")
+    parser.add_argument("--truck-ratio", type=float, default=0.25, help="share of length-3 vehicles")
+    parser.add_argument("--walls", type=int, default=0, help="walls per board")
+    parser.add_argument("--min-moves", type=int, default=0, help="shortest optimal solution to keep")
+    parser.add_argument("--attempts", type=int, default=200, help="random boards to try")
+    parser.add_argument("--max-states", type=int, default=200000,
+                        help="state budget per board for enumeration or solving")
+    parser.add_argument("--seed", type=int, default=None, help="random seed (reproducible output)")
+    args = parser.parse_args(argv)
+
+    height, width = args.size
+    puzzles = generate(args.count, height, width, args.vehicles, args.truck_ratio, args.walls,
+                       args.min_moves, args.attempts, args.max_states, args.seed)
+
+    os.makedirs(args.outdir, exist_ok=True)
+    for i, (moves, puzzle) in enumerate(puzzles):
+        path = os.path.join(args.outdir, f"gen-{height}x{width}-{i:03d}-{moves}moves.csv")
+        puzzle.saveVehicles(path)
+        print(f"{path}: {moves} moves, {len(puzzle.vehicles)} vehicles, {len(puzzle.walls)} walls")
+    if len(puzzles) < args.count:
+        print(f"only {len(puzzles)} of {args.count} puzzles met the criteria; try more --attempts")
+
+
+if __name__ == "__main__":
+    main()
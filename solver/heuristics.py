@@ -0,0 +1,303 @@
+# Heuristic functions. Each one is a Heuristic: h(node) as before, or
+# h.evaluate(state) without building a Node; values are memoized per board.
+from collections import OrderedDict
+
+from .node import Node
+
+# Values kept per board and heuristic (oldest evicted first)
+MEMO_SIZE = 100000
+
+
+class HeuristicCache:
+    # Data shared by every state of one board (RushHourPuzzle children inherit
+    # it, BitboardStates keep it on their BoardInfo, which shares it with the
+    # puzzle it was made from): the index of X, a vid -> vehicle index map
+    # built once, and a memo of values per heuristic. Not pickled with the
+    # states: a memo is only ever used in the process that filled it
+    def __init__(self, vids, height, width):
+        self.vehicle_index = {vid: i for i, vid in enumerate(vids)}
+        self.x_index = self.vehicle_index.get("X")
+        # Positions packed as in BitboardState layouts
+        self.pos_bits = max(height, width).bit_length()
+        self.memos = {}
+
+    def key(self, state):
+        # The exact layout of state: equal for a RushHourPuzzle and the
+        # BitboardState of the same configuration
+        layout = getattr(state, "layout", None)
+        if layout is None:
+            layout = 0
+            shift = 0
+            pos_bits = self.pos_bits
+            for v in state.vehicles:
+                layout |= (v.col if v.orientation == "H" else v.row) << shift
+                shift += pos_bits
+        return layout
+
+
+def boardCache(state):
+    cache = state.heuristic_cache
+    if cache is None:
+        cache = state.heuristic_cache = HeuristicCache([v.vid for v in state.vehicles],
+                                                       state.board_height, state.board_width)
+    return cache
+
+
+class Heuristic:
+    # fn(state, cache) memoized in the board's HeuristicCache, so searches over
+    # the same board (A* then IDA*, reruns in the visualizers) share values.
+    # Values are keyed by the state's full layout, never by a hash, so two
+    # states cannot share an entry; at most memo_size values are kept per board
+    def __init__(self, fn, memo_size=MEMO_SIZE):
+        self.fn = fn
+        self.memo_size = memo_size
+        self.__name__ = fn.__name__.lstrip("_")
+
+    def __call__(self, node):
+        return self.evaluate(node.state)
+
+    def evaluate(self, state):
+        cache = boardCache(state)
+        memo = cache.memos.get(self)
+        if memo is None:
+            memo = cache.memos[self] = OrderedDict()
+        key = cache.key(state)
+        value = memo.get(key)
+        if value is None:
+            value = memo[key] = self.fn(state, cache)
+            if len(memo) > self.memo_size:
+                memo.popitem(last=False)
+        return value
+
+    def __repr__(self):
+        return f"<heuristic {self.__name__}>"
+
+
+def _h1(state, cache):
+    vehicles = state.vehicles
+    red_car = None if cache.x_index is None else vehicles[cache.x_index]
+    
+    if not red_car or red_car.orientation != "H":
+        return float('inf')
+    
+    # Distance from the front of the red car to the right edge
+    distance = state.board_width - (red_car.col + red_car.length)
+    return distance
+
+def _h2(state, cache):
+    vehicles = state.vehicles
+    red_car = None if cache.x_index is None else vehicles[cache.x_index]
+    
+    if not red_car or red_car.orientation != "H":
+        return float('inf')
+    
+    # Calculate h1
+    h1_value = state.board_width - (red_car.col + red_car.length)
+    
+    # Count vehicles blocking the path
+    blocking_count = 0
+    red_car_row = red_car.row
+    red_car_front_col = red_car.col + red_car.length
+    # Bitboard states build their board on every access: read it once
+    board = state.board
+    
+    # Check each column from the red car's front to the exit
+    for col in range(red_car_front_col, state.board_width):
+        cell_content = board[red_car_row][col]
+        if cell_content != '.' and cell_content != 'X':
+            blocking_count += 1
+    
+    return h1_value + blocking_count
+
+def _h3(state, cache):
+    # take in considiration : The distance to exit like h1, The number of blocking vehicles like h2,The minimum number of moves needed to clear 
+   # each blocking vehicle
+    
+    vehicles = state.vehicles
+    red_car = None if cache.x_index is None else vehicles[cache.x_index]
+    
+    if not red_car or red_car.orientation != "H":
+        return float('inf')
+    
+    # Calculate h1
+    h1_value = state.board_width - (red_car.col + red_car.length)
+    
+    # Count vehicles blocking the path and estimate moves to clear them
+    total_blocking_cost = 0
+    red_car_row = red_car.row
+    red_car_front_col = red_car.col + red_car.length
+    
+    blocking_vehicles = set()
+    # Bitboard states build their board on every access: read it once
+    board = state.board
+    
+    # First pass: identify all blocking vehicles
+    for col in range(red_car_front_col, state.board_width):
+        cell_content = board[red_car_row][col]
+        if cell_content != '.' and cell_content != 'X' and cell_content not in blocking_vehicles:
+            blocking_vehicles.add(cell_content)
+    
+    # For each blocking vehicle, estimate minimum moves to clear it
+    for vid in blocking_vehicles:
+        index = cache.vehicle_index.get(vid)
+        if index is None:
+            # A wall, not a vehicle
+            continue
+        blocking_vehicle = vehicles[index]
+            
+        if blocking_vehicle.orientation == "H":
+            # Horizontal vehicles can't be on the same row as red car and block it
+            # This shouldn't happen in valid states
+            total_blocking_cost += 2  # Conservative estimate
+        else:
+            # Vertical vehicle blocking the path
+            # Minimum moves to clear: need to move it up or down
+            # Check available space above and below
+            
+            space_above = 0
+            space_below = 0
+            
+            # Check space above
+            for r in range(blocking_vehicle.row - 1, -1, -1):
+                if board[r][blocking_vehicle.col] == '.':
+                    space_above += 1
+                else:
+                    break
+            
+            # Check space below  
+            for r in range(blocking_vehicle.row + blocking_vehicle.length, state.board_height):
+                if board[r][blocking_vehicle.col] == '.':
+                    space_below += 1
+                else:
+                    break
+            
+            # Minimum moves needed: at least 1 to move, plus potentially more if space is limited
+            min_moves = 1
+            if space_above == 0 and space_below == 0:
+                # Vehicle is completely blocked, will need multiple moves to clear
+                min_moves = 3  # Conservative estimate
+            elif space_above < blocking_vehicle.length and space_below < blocking_vehicle.length:
+                # Limited space in both directions
+                min_moves = 2
+            
+            total_blocking_cost += min_moves
+    
+    return h1_value + total_blocking_cost
+
+def _clearingPaths(board, height, width, vehicle, row, col):
+    # Ways for vehicle to get off cell (row, col): for each direction it can slide,
+    # the vehicles in the cells it must pass through to clear the cell (minimum
+    # displacement), each with one cell of its own it then has to leave.
+    # Directions running into a wall or off the board are left out.
+    length = vehicle.length
+    paths = []
+    if vehicle.orientation == "H":
+        line = board[row]
+        # Left: the back ends at col - length; right: the front ends at col + length
+        for first, last in ((col - length, vehicle.col), (vehicle.col + length, col + length + 1)):
+            if first < 0 or last > width:
+                continue
+            blockers = {}
+            for c in range(first, last):
+                content = line[c]
+                if content == "#":
+                    break
+                if content != ".":
+                    blockers[content] = (row, c)
+            else:
+                paths.append(blockers)
+    else:
+        # Up: the back ends at row - length; down: the front ends at row + length
+        for first, last in ((row - length, vehicle.row), (vehicle.row + length, row + length + 1)):
+            if first < 0 or last > height:
+                continue
+            blockers = {}
+            for r in range(first, last):
+                content = board[r][col]
+                if content == "#":
+                    break
+                if content != ".":
+                    blockers[content] = (r, col)
+            else:
+                paths.append(blockers)
+    return paths
+
+def _h4(state, cache):
+    # Admissible blocking-graph bound, in moves (a slide of any length costs 1).
+    # The red car must move once, and so must every vehicle in its way to the
+    # exit. A vehicle that has to get off a cell slides up/down (or left/right)
+    # far enough to clear it; a vehicle standing in the way in every one of
+    # those directions must move as well, recursively. Each vehicle is counted
+    # once, so the bound never exceeds the real number of moves.
+    vehicles = state.vehicles
+    red_car = None if cache.x_index is None else vehicles[cache.x_index]
+
+    if not red_car or red_car.orientation != "H":
+        return float('inf')
+
+    width = state.board_width
+    red_car_row = red_car.row
+    red_car_front_col = red_car.col + red_car.length
+    if red_car_front_col == width:
+        return 0
+
+    # (vehicle, cell it has to leave) still to examine
+    board = state.board
+    row = board[red_car_row]
+    pending = []
+    for col in range(red_car_front_col, width):
+        cell_content = row[col]
+        if cell_content == "#":
+            return float('inf')
+        if cell_content != '.':
+            pending.append((cell_content, red_car_row, col))
+    if not pending:
+        return 1
+
+    vehicle_index = cache.vehicle_index
+    height = state.board_height
+    must_move = {vid for vid, _, _ in pending}
+    seen = set(pending)
+    while pending:
+        vid, r, c = pending.pop()
+        paths = _clearingPaths(board, height, width, vehicles[vehicle_index[vid]], r, c)
+        if not paths:
+            # It can never leave the cell: no solution from here
+            return float('inf')
+
+        # Vehicles in the way whichever direction is taken
+        first = paths[0]
+        for blocker in first:
+            if blocker == 'X':
+                continue
+            cell = first[blocker]
+            for path in paths[1:]:
+                if blocker not in path:
+                    break
+                if path[blocker] != cell:
+                    cell = None
+            else:
+                must_move.add(blocker)
+                # Follow it further only when it has one definite cell to leave
+                if cell is not None:
+                    item = (blocker,) + cell
+                    if item not in seen:
+                        seen.add(item)
+                        pending.append(item)
+
+    return 1 + len(must_move)
+
+
+h1 = Heuristic(_h1)
+h2 = Heuristic(_h2)
+h3 = Heuristic(_h3)
+h4 = Heuristic(_h4)
+
+
+def stateHeuristic(h):
+    # h as a function of states: h.evaluate for Heuristic and PatternDatabase,
+    # otherwise a wrapper building the Node a plain h(node) expects
+    evaluate = getattr(h, "evaluate", None)
+    if evaluate is not None:
+        return evaluate
+    return lambda state: h(Node(state))
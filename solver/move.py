@@ -0,0 +1,49 @@
+class Move(tuple):
+    # One move as (vehicle id, direction, distance). Successor functions hand
+    # out shared instances from a per-board table (moveTable), so generating a
+    # child costs no allocation or string formatting. A Move is not a string:
+    # str() renders the text "Move <vid> <direction> <distance>" that
+    # Node.getSolution returns, and code comparing against that text must call it
+    __slots__ = ()
+
+    def __new__(cls, vid, direction, distance):
+        return tuple.__new__(cls, (vid, direction, distance))
+
+    def __getnewargs__(self):
+        # pickle and copy call __new__ with the three fields
+        return tuple(self)
+
+    @property
+    def vid(self):
+        return self[0]
+
+    @property
+    def direction(self):
+        return self[1]
+
+    @property
+    def distance(self):
+        return self[2]
+
+    def __str__(self):
+        return f"Move {self[0]} {self[1]} {self[2]}"
+
+    def __format__(self, spec):
+        return format(str(self), spec)
+
+    def __repr__(self):
+        return f"Move({self[0]!r}, {self[1]!r}, {self[2]!r})"
+
+
+def moveTable(vids, orientations, height, width):
+    # table[i] = (back, front): back[d] / front[d] is vehicle i's move by d
+    # cells left or up / right or down (index 0 unused)
+    table = []
+    for vid, orientation in zip(vids, orientations):
+        if orientation == "H":
+            back, front, limit = "left", "right", width
+        else:
+            back, front, limit = "up", "down", height
+        table.append(([None] + [Move(vid, back, d) for d in range(1, limit)],
+                      [None] + [Move(vid, front, d) for d in range(1, limit)]))
+    return table
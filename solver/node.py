@@ -0,0 +1,153 @@
+from array import array
+
+from .move import Move
+
+
+class Node:
+    __slots__ = ("state", "parent", "action", "g", "f")
+
+    def __init__(self, state, parent=None, action=None, g=0, f=0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.g = g
+        self.f = f
+    
+    def getPath(self):
+        path = []
+        current = self
+        while current is not None:
+            path.append(current.state)
+            current = current.parent
+        path.reverse()
+        return path
+    
+    def getSolution(self):
+        # Action strings; Move objects are rendered here, once per solution step
+        actions = []
+        current = self
+        while current.parent is not None:
+            actions.append(str(current.action))
+            current = current.parent
+        actions.reverse()
+        return actions
+    
+    def __eq__(self, other):
+        if not isinstance(other, Node):
+            return False
+        return self.state == other.state
+    
+    def __hash__(self):
+        return hash(self.state)
+    
+    def __lt__(self, other):
+        # For priority queue comparison
+        return self.f < other.f
+
+
+DIRECTIONS = ("left", "right", "up", "down")
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+class NodeTable:
+    # Struct-of-arrays node store: the parent index, packed move, g and f of
+    # node i are parents[i], moves[i], g[i] and f[i] in typed arrays, 20 bytes
+    # per node instead of a Node object and its action string. A move is
+    # packed as (vehicle number << 10) | (direction << 8) | distance; vehicles
+    # are numbered in the order their moves are first seen. States are not
+    # stored: TableNode replays the moves when the path is asked for
+    def __init__(self):
+        self.parents = array("i")
+        self.moves = array("I")
+        self.g = array("I")
+        self.f = array("d")
+        self.vids = []
+        self.vehicle_numbers = {}
+        self.codes = {}
+
+    def __len__(self):
+        return len(self.parents)
+
+    def encode(self, action):
+        # action is a Move or its text
+        code = self.codes.get(action)
+        if code is None:
+            if isinstance(action, Move):
+                vid, direction, distance = action
+            else:
+                _, vid, direction, distance = action.split(" ")
+            number = self.vehicle_numbers.get(vid)
+            if number is None:
+                number = self.vehicle_numbers[vid] = len(self.vids)
+                self.vids.append(vid)
+            code = self.codes[action] = (number << 10) | (DIRECTION_CODES[direction] << 8) | int(distance)
+        return code
+
+    def decode(self, code):
+        return Move(self.vids[code >> 10], DIRECTIONS[(code >> 8) & 3], code & 0xFF)
+
+    def add(self, parent, action, g, f=0):
+        # Index of a new node; parent is -1 and action None for the root
+        self.parents.append(parent)
+        self.moves.append(0 if action is None else self.encode(action))
+        self.g.append(g)
+        self.f.append(f)
+        return len(self.parents) - 1
+
+    def solution(self, index):
+        # Action strings from the root to node index
+        codes = []
+        while self.parents[index] >= 0:
+            codes.append(self.moves[index])
+            index = self.parents[index]
+        codes.reverse()
+        return [str(self.decode(code)) for code in codes]
+
+
+class TableNode:
+    # Search result backed by a NodeTable, with Node's attributes and
+    # getPath/getSolution: action strings are decoded and intermediate states
+    # rebuilt (by replaying the moves from start) only when asked for
+    __slots__ = ("table", "index", "start", "_state")
+
+    def __init__(self, table, index, start, state=None):
+        self.table = table
+        self.index = index
+        self.start = start
+        self._state = state
+
+    @property
+    def state(self):
+        if self._state is None:
+            self._state = self.getPath()[-1]
+        return self._state
+
+    @property
+    def parent(self):
+        parent = self.table.parents[self.index]
+        return None if parent < 0 else TableNode(self.table, parent, self.start)
+
+    @property
+    def action(self):
+        # The Move that led here (None at the root), as on Node
+        if self.table.parents[self.index] < 0:
+            return None
+        return self.table.decode(self.table.moves[self.index])
+
+    @property
+    def g(self):
+        return self.table.g[self.index]
+
+    @property
+    def f(self):
+        return self.table.f[self.index]
+
+    def getSolution(self):
+        return self.table.solution(self.index)
+
+    def getPath(self):
+        path = [self.start]
+        for action in self.getSolution():
+            path.append(next(child for child_action, child in path[-1].successorFunction()
+                             if str(child_action) == action))
+        return path
@@ -0,0 +1,285 @@
+# Breadth-first search spread over worker processes. Every layout belongs to
+# one worker, picked by a hash of the layout; each worker keeps the visited
+# layouts it owns (with their parent layouts) and its share of the frontier.
+# All workers expand their share of a layer at the same time. The children
+# owned by other workers are written to a shared memory segment, one byte
+# range per destination. After the layer each worker reads its ranges from
+# every segment, drops the layouts it has already visited and keeps the rest
+# as its share of the next layer. The solution path is rebuilt by asking each
+# layout's owner for its parent.
+import os
+import time
+
+from .bitboard import BitboardState
+from .search import _layoutPath
+
+# Multiplier of the ownership hash (Fibonacci hashing). The low bits of a
+# layout are the position of a single vehicle, so on their own they would
+# split the states very unevenly
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def owner(layout, workers):
+    # Index of the worker that owns layout
+    return (layout * HASH_MULTIPLIER >> 32) % workers
+
+
+def _records(data, size):
+    # (child, parent) pairs packed as two big-endian layouts of size bytes
+    for i in range(0, len(data), 2 * size):
+        yield int.from_bytes(data[i:i + size], "big"), int.from_bytes(data[i + size:i + 2 * size], "big")
+
+
+class _Partition:
+    # One worker's share of the search
+    def __init__(self, info, successorsFn, isGoal, index, workers):
+        self.info = info
+        self.successorsFn = successorsFn
+        self.isGoal = isGoal
+        self.index = index
+        self.workers = workers
+        # layout -> parent layout (None for the start) of every owned layout seen
+        self.visited = {}
+        self.frontier = []
+        # Children of the last expansion that this worker owns itself
+        self.local = {}
+        # Children of the last expansion for the other workers; unlinked at the
+        # next expansion, when every worker has read its ranges
+        self.segment = None
+
+    def seed(self, layout):
+        self.visited[layout] = None
+        self.frontier.append(layout)
+        return len(self.frontier)
+
+    def expand(self):
+        # Expand the frontier. Returns (segment name, [(start, end)] byte range
+        # per worker, goal, expanded, generated); goal is the (layout, parent)
+        # of a goal child, or None
+        from multiprocessing.shared_memory import SharedMemory
+
+        self._release()
+        info, workers, isGoal = self.info, self.workers, self.isGoal
+        buckets = [{} for _ in range(workers)]
+        generated = 0
+        for expanded, parent in enumerate(self.frontier, 1):
+            children = self.successorsFn(BitboardState(info, parent))
+            generated += len(children)
+            for _, child in children:
+                layout = child.layout
+                if isGoal(child):
+                    return None, None, (layout, parent), expanded, generated
+                bucket = buckets[owner(layout, workers)]
+                if layout not in bucket:
+                    bucket[layout] = parent
+        expanded = len(self.frontier)
+        self.frontier = []
+        self.local = buckets[self.index]
+        buckets[self.index] = {}
+
+        size = info.layout_bytes
+        chunks = [b"".join(child.to_bytes(size, "big") + parent.to_bytes(size, "big")
+                           for child, parent in bucket.items())
+                  for bucket in buckets]
+        bounds = []
+        offset = 0
+        for chunk in chunks:
+            bounds.append((offset, offset + len(chunk)))
+            offset += len(chunk)
+        if not offset:
+            return None, bounds, None, expanded, generated
+
+        self.segment = SharedMemory(create=True, size=offset)
+        for chunk, (start, end) in zip(chunks, bounds):
+            self.segment.buf[start:end] = chunk
+        return self.segment.name, bounds, None, expanded, generated
+
+    def merge(self, sources):
+        # Keep the children sent to this worker by every expansion in sources
+        # (the (segment name, bounds) of each worker) that it has not visited
+        # yet: they are its share of the next layer. Returns their number
+        from multiprocessing.shared_memory import SharedMemory
+
+        size = self.info.layout_bytes
+        visited = self.visited
+        batches = [self.local.items()]
+        for name, bounds in sources:
+            start, end = bounds[self.index] if bounds else (0, 0)
+            if start == end:
+                continue
+            segment = SharedMemory(name=name)
+            with segment.buf[start:end] as view:
+                data = bytes(view)
+            segment.close()
+            batches.append(_records(data, size))
+
+        for batch in batches:
+            for child, parent in batch:
+                if child not in visited:
+                    visited[child] = parent
+                    self.frontier.append(child)
+        self.local = {}
+        return len(self.frontier)
+
+    def parent(self, layout):
+        return self.visited[layout]
+
+    def _release(self):
+        if self.segment is not None:
+            self.segment.close()
+            self.segment.unlink()
+            self.segment = None
+
+    def close(self):
+        self._release()
+
+
+def _partitionWorker(connection, *args):
+    # Process body of a worker: runs the _Partition commands it receives
+    partition = _Partition(*args)
+    try:
+        while True:
+            command, args = connection.recv()
+            if command == "close":
+                break
+            try:
+                result = getattr(partition, command)(*args)
+            except Exception as exc:
+                result = exc
+            connection.send(result)
+    finally:
+        partition.close()
+
+
+class _LocalPartition:
+    # A _Partition run in this process, behind the same send/receive calls as
+    # a worker process
+    def __init__(self, *args):
+        self.partition = _Partition(*args)
+        self.result = None
+
+    def send(self, command, *args):
+        self.result = getattr(self.partition, command)(*args)
+
+    def receive(self):
+        return self.result
+
+    def close(self):
+        self.partition.close()
+
+
+class _RemotePartition:
+    # A _Partition run by a worker process: send starts a command, receive
+    # waits for its result, so every worker can run one at the same time
+    def __init__(self, *args):
+        import multiprocessing
+
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_partitionWorker, args=(child, *args), daemon=True)
+        self.process.start()
+        child.close()
+
+    def send(self, command, *args):
+        self.connection.send((command, args))
+
+    def receive(self):
+        result = self.connection.recv()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self):
+        try:
+            self.connection.send(("close", ()))
+        except OSError:
+            pass
+        self.process.join(5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+
+def ParallelBFS(s, successorsFn, isGoal, workers=None, stats=None):
+    # Breadth-first search over bitboard layouts with the visited set and the
+    # frontier split between worker processes by layout hash (see above).
+    # Returns the same cost as BFS, with a path through Nodes of the type of s.
+    # workers: number of processes (default: one per CPU). Daemon processes,
+    # such as the portfolio's and the batch runner's, cannot start children:
+    # there the search runs in this process as a single partition, and
+    # stats.workers records the number of processes actually used.
+    # successorsFn and isGoal must be picklable where processes are spawned
+    # rather than forked.
+    # stats: optional SearchStats to fill in; Open is the largest layer and
+    # Closed every layout visited
+    import multiprocessing
+
+    start_time = time.time()
+    start = s if isinstance(s, BitboardState) else s.toBitboard()
+    info = start.info
+    if workers is None:
+        workers = os.cpu_count() or 1
+    remote = workers > 1 and not multiprocessing.current_process().daemon
+    if remote:
+        # Start the resource tracker before the workers so they all share it:
+        # a segment a reader attaches to is then released by its creator's unlink
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+    else:
+        workers = 1
+
+    Partition = _RemotePartition if remote else _LocalPartition
+    partitions = [Partition(info, successorsFn, isGoal, i, workers) for i in range(workers)]
+    goal = (start.layout, None) if isGoal(start) else None
+    expanded = generated = duplicates = 0
+    try:
+        if goal is None:
+            partition = partitions[owner(start.layout, workers)]
+            partition.send("seed", start.layout)
+            count = partition.receive()
+            stored = count
+
+        while goal is None and count:
+            for partition in partitions:
+                partition.send("expand")
+            results = [partition.receive() for partition in partitions]
+            expanded += sum(result[3] for result in results)
+            layer_generated = sum(result[4] for result in results)
+            generated += layer_generated
+            goals = [result[2] for result in results if result[2] is not None]
+            if goals:
+                goal = goals[0]
+                break
+
+            sources = [(name, bounds) for name, bounds, *_ in results]
+            for partition in partitions:
+                partition.send("merge", sources)
+            count = sum(partition.receive() for partition in partitions)
+            duplicates += layer_generated - count
+            stored += count
+            if stats is not None:
+                stats.frontier(count, stored)
+
+        node = None
+        if goal is not None:
+            path = [goal[0]]
+            parent = goal[1]
+            while parent is not None:
+                path.append(parent)
+                partition = partitions[owner(parent, workers)]
+                partition.send("parent", parent)
+                parent = partition.receive()
+            path.reverse()
+            node = _layoutPath(s, info, path, successorsFn)
+    finally:
+        for partition in partitions:
+            partition.close()
+
+    elapsed = time.time() - start_time
+    if stats is not None:
+        stats.expanded += expanded
+        stats.generated += generated
+        stats.duplicates += duplicates
+        stats.workers = workers
+        stats.elapsed = elapsed
+    return node, elapsed
@@ -0,0 +1,195 @@
+import mmap
+import os
+
+from .bitboard import BoardInfo
+from .cachefiles import CACHE_BYTES, defaultCacheDir, evictFiles, touch, writeAtomic
+from .puzzle import zobristKey
+
+# Table value of abstract states no goal can be reached from (and of overlapping layouts)
+UNREACHABLE = 255
+
+
+class PatternDatabase:
+    # Pattern database heuristic. The board is abstracted to X, the vehicles that
+    # can cross X's row and the vehicles that can block those; every other vehicle
+    # is removed. Removing vehicles only frees cells, so the exact distance of the
+    # abstraction (computed once by a backward BFS from every goal) is an
+    # admissible bound on the real one.
+    #
+    # The table depends only on the board size, the walls and, for each vehicle
+    # of the pattern, its orientation, line, length and the range it can slide in.
+    # It is stored under cache_dir with a name derived from those, one byte per
+    # abstract state, and memory-mapped: other puzzles with the same pattern
+    # reuse it without rebuilding. max_entries (bytes per table) caps the
+    # pattern size. cache_bytes caps the directory: once a new table is written,
+    # the least recently used ones are deleted until it fits.
+    def __init__(self, puzzle, cache_dir=None, max_entries=1 << 24, cache_bytes=CACHE_BYTES):
+        self.cache_dir = cache_dir or defaultCacheDir("pdb")
+        self.cache_bytes = cache_bytes
+        info = BoardInfo(puzzle)
+        x = info.x_index
+        if x is None or info.orientations[x] != "H":
+            raise ValueError("the pattern database needs a horizontal X vehicle")
+
+        positions = [v.col if v.orientation == "H" else v.row for v in puzzle.vehicles]
+        bounds = [info.segment(i, p) for i, p in enumerate(positions)]
+
+        # Pattern vehicles in a canonical order (X first) so that puzzles with
+        # the same pattern map to the same table
+        chosen = self._choosePattern(info, bounds, max_entries)
+        specs = {i: (info.orientations[i], info.lines[i], info.lengths[i]) + bounds[i] for i in chosen}
+        others = sorted((i for i in chosen if i != x), key=lambda i: (specs[i], positions[i]))
+        self.vehicles = [x] + others
+        self.specs = [specs[i] for i in self.vehicles]
+
+        # Mixed-radix index: slot k holds (position - low) with stride strides[k]
+        self.lows = [spec[3] for spec in self.specs]
+        self.radixes = [spec[4] - spec[3] + 1 for spec in self.specs]
+        self.strides = []
+        size = 1
+        for radix in self.radixes:
+            self.strides.append(size)
+            size *= radix
+        self.size = size
+
+        key = zobristKey(info.board_height, info.board_width, tuple(sorted(info.walls)), tuple(self.specs))
+        self.path = os.path.join(self.cache_dir, f"{key:016x}.pdb")
+        self.table = self._load(info)
+
+    @staticmethod
+    def _choosePattern(info, bounds, max_entries):
+        x = info.x_index
+
+        def reach(i):
+            # Every cell vehicle i can ever cover
+            mask = 0
+            for p in range(bounds[i][0], bounds[i][1] + 1):
+                mask |= info.masks[i][p]
+            return mask
+
+        def radix(i):
+            return bounds[i][1] - bounds[i][0] + 1
+
+        row = info.lines[x]
+        x_row = 0
+        for col in range(bounds[x][0], info.board_width):
+            x_row |= info.cellBit(row, col)
+
+        reaches = [reach(i) for i in range(len(info.vids))]
+        chosen = [x]
+        size = radix(x)
+        # Vehicles crossing X's row first, then the vehicles that can block them,
+        # most overlapping first, while the table stays within max_entries
+        crossing = [i for i in range(len(info.vids)) if i != x and reaches[i] & x_row]
+        crossing.sort(key=lambda i: -bin(reaches[i] & x_row).count("1"))
+        for i in crossing:
+            if size * radix(i) <= max_entries:
+                chosen.append(i)
+                size *= radix(i)
+
+        crossing_reach = 0
+        for i in chosen[1:]:
+            crossing_reach |= reaches[i]
+        blocking = [i for i in range(len(info.vids)) if i not in chosen and reaches[i] & crossing_reach]
+        blocking.sort(key=lambda i: -bin(reaches[i] & crossing_reach).count("1"))
+        for i in blocking:
+            if size * radix(i) <= max_entries:
+                chosen.append(i)
+                size *= radix(i)
+        return chosen
+
+    def _load(self, info):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) != self.size:
+            writeAtomic(self.path, self._build(info))
+            evictFiles(self.cache_dir, ".pdb", self.cache_bytes, keep=self.path)
+        else:
+            touch(self.path)
+
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _build(self, info):
+        # Cell masks of each pattern slot, indexed by position
+        masks = [info.masks[i] for i in self.vehicles]
+        wall_mask = info.wall_mask
+        lows, highs = self.lows, [spec[4] for spec in self.specs]
+        strides = self.strides
+        slots = range(len(self.vehicles))
+
+        table = bytearray([UNREACHABLE]) * self.size
+
+        # Goals: X at the exit, every other slot anywhere in its range without overlaps
+        goal_pos = info.board_width - info.lengths[self.vehicles[0]]
+        frontier = []
+        if lows[0] <= goal_pos <= highs[0]:
+            def place(k, occupied, index):
+                if k == len(self.vehicles):
+                    table[index] = 0
+                    frontier.append(index)
+                    return
+                for pos in range(lows[k], highs[k] + 1):
+                    if not occupied & masks[k][pos]:
+                        place(k + 1, occupied | masks[k][pos], index + (pos - lows[k]) * strides[k])
+
+            place(1, wall_mask | masks[0][goal_pos], (goal_pos - lows[0]) * strides[0])
+
+        # Backward BFS, one layer at a time (moves are reversible). Distances
+        # past 254 are stored as 254, which keeps the bound admissible
+        distance = 0
+        while frontier:
+            distance = min(distance + 1, UNREACHABLE - 1)
+            next_frontier = []
+            for index in frontier:
+                positions = []
+                occupied = wall_mask
+                for k in slots:
+                    pos = lows[k] + index // strides[k] % self.radixes[k]
+                    positions.append(pos)
+                    occupied |= masks[k][pos]
+
+                for k in slots:
+                    pos = positions[k]
+                    vehicle_masks = masks[k]
+                    free = occupied & ~vehicle_masks[pos]
+                    stride = strides[k]
+                    for new_pos in range(pos - 1, lows[k] - 1, -1):
+                        if free & vehicle_masks[new_pos]:
+                            break
+                        child = index - (pos - new_pos) * stride
+                        if table[child] == UNREACHABLE:
+                            table[child] = distance
+                            next_frontier.append(child)
+                    for new_pos in range(pos + 1, highs[k] + 1):
+                        if free & vehicle_masks[new_pos]:
+                            break
+                        child = index + (new_pos - pos) * stride
+                        if table[child] == UNREACHABLE:
+                            table[child] = distance
+                            next_frontier.append(child)
+            frontier = next_frontier
+        return table
+
+    def lookup(self, state):
+        # Abstract distance of a RushHourPuzzle or BitboardState of this puzzle
+        index = 0
+        layout = getattr(state, "layout", None)
+        if layout is not None:
+            info = state.info
+            for k, i in enumerate(self.vehicles):
+                pos = (layout >> info.shifts[i]) & info.pos_mask
+                index += (pos - self.lows[k]) * self.strides[k]
+        else:
+            vehicles = state.vehicles
+            for k, i in enumerate(self.vehicles):
+                v = vehicles[i]
+                pos = v.col if v.orientation == "H" else v.row
+                index += (pos - self.lows[k]) * self.strides[k]
+        value = self.table[index]
+        return float('inf') if value == UNREACHABLE else value
+
+    # State interface of the heuristics (h.evaluate(state))
+    evaluate = lookup
+
+    def __call__(self, node):
+        # Heuristic interface: h(node)
+        return self.lookup(node.state)
@@ -0,0 +1,307 @@
+import csv
+import hashlib
+
+from .move import moveTable
+
+
+def zobristKey(*parts):
+    # Deterministic 64-bit key: unlike hash() of strings it is the same in every process
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Vehicle:
+    __slots__ = ("vid", "row", "col", "orientation", "length")
+
+    def __init__(self, vid, x, y, orientation, length):
+        self.vid = vid
+        self.row = int(y)              
+        self.col = int(x)              
+        self.orientation = orientation 
+        self.length = int(length)
+
+    def moved(self, new_row, new_col):
+        # Copy of this vehicle at another position (skips the int parsing of __init__)
+        vehicle = Vehicle.__new__(Vehicle)
+        vehicle.vid = self.vid
+        vehicle.row = new_row
+        vehicle.col = new_col
+        vehicle.orientation = self.orientation
+        vehicle.length = self.length
+        return vehicle
+
+    def __repr__(self):
+        return f"Vehicle({self.vid}, {self.col}, {self.row}, {self.orientation}, {self.length})"
+
+
+class RushHourPuzzle:
+    def __init__(self):
+        self.board_height = 0
+        self.board_width = 0
+        self.vehicles = []
+        self.walls = []
+        self.board = []
+        # Zobrist keys per (vehicle, position), shared by all states of the same board
+        self.zobrist = None
+        self._hash = None
+        # Move objects per (vehicle, direction, distance), and the heuristics'
+        # per-board data (see heuristics.HeuristicCache), shared the same way
+        self.moves = None
+        self.heuristic_cache = None
+
+    # A successor only records the move that created it; its board rows are
+    # derived from the parent's board the first time they are needed
+    @property
+    def board(self):
+        if self._delta is not None:
+            self._applyDelta()
+        return self._board
+
+    @board.setter
+    def board(self, value):
+        self._board = value
+        self._delta = None
+
+    def __getstate__(self):
+        # The heuristic memo stays in this process (see heuristics.HeuristicCache)
+        state = self.__dict__.copy()
+        state["heuristic_cache"] = None
+        return state
+
+    def setVehicles(self, filename):
+        with open(filename, newline="") as f:
+            reader = csv.reader(f)
+            lines = list(reader)
+
+        # First line = board dimensions
+        self.board_height, self.board_width = map(int, lines[0])
+
+        # Reset vehicles, walls and the board, hash and move data derived from them
+        self.vehicles = []
+        self.walls = []
+        self.board = []
+        self.zobrist = None
+        self._hash = None
+        self.moves = None
+        self.heuristic_cache = None
+
+        # Load each line
+        for line in lines[1:]:
+            if line[0] == "#":
+                # It's a wall (format: #,x,y)
+                x, y = int(line[1]), int(line[2])
+                self.walls.append((y, x))  # store as (row, col)
+            else:
+                # It's a vehicle
+                vid, x, y, orientation, length = line
+                self.vehicles.append(Vehicle(vid, x, y, orientation, length))
+
+    def saveVehicles(self, filename):
+        # Write the puzzle in the format setVehicles reads
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow([self.board_height, self.board_width])
+            for v in self.vehicles:
+                writer.writerow([v.vid, v.col, v.row, v.orientation, v.length])
+            for (r, c) in self.walls:
+                writer.writerow(["#", c, r])
+
+    def setBoard(self):
+        self.board = [["." for _ in range(self.board_width)] for _ in range(self.board_height)]
+
+        # Place vehicles
+        for v in self.vehicles:
+            if v.orientation == "H":
+                for i in range(v.length):
+                    self.board[v.row][v.col + i] = v.vid
+            else:  # Vertical
+                for i in range(v.length):
+                    self.board[v.row + i][v.col] = v.vid
+
+        # Place walls
+        for (r, c) in self.walls:
+            self.board[r][c] = "#"
+
+    def display(self):
+        for row in self.board:
+            print(" ".join(row))
+        print()
+
+    def isGoal(self):
+        # Find the red car
+        red_car = None
+        for v in self.vehicles:
+            if v.vid == 'X':
+                red_car = v
+                break
+        
+        if not red_car:
+            return False
+        
+        if red_car.orientation == "H":
+            # Check if front of red car is at the rightmost column
+            return red_car.col + red_car.length == self.board_width
+        return False
+
+    def successorFunction(self):
+        successors = []
+
+        # Children are derived from the parent's board, so the board must exist
+        board = self.board
+        if not board:
+            self.setBoard()
+            board = self.board
+        # Children update the parent's hash incrementally, so compute it first
+        hash(self)
+        moves = self._moveTable()
+
+        width, height = self.board_width, self.board_height
+        create = self._createSuccessorState
+        append = successors.append
+
+        # Each vehicle can slide along the free run of empty cells behind it
+        # (left/up) and ahead of it (right/down); every cell of the run is one
+        # legal move, so no per-move validity check is needed
+        for idx, vehicle in enumerate(self.vehicles):
+            row, col, length = vehicle.row, vehicle.col, vehicle.length
+            back, ahead = moves[idx]
+
+            if vehicle.orientation == "H":
+                line = board[row]
+                new_col = col - 1
+                while new_col >= 0 and line[new_col] == ".":
+                    append((back[col - new_col], create(idx, row, new_col)))
+                    new_col -= 1
+
+                front = col + length
+                while front < width and line[front] == ".":
+                    append((ahead[front - col - length + 1], create(idx, row, front - length + 1)))
+                    front += 1
+            else:  # Vertical
+                new_row = row - 1
+                while new_row >= 0 and board[new_row][col] == ".":
+                    append((back[row - new_row], create(idx, new_row, col)))
+                    new_row -= 1
+
+                front = row + length
+                while front < height and board[front][col] == ".":
+                    append((ahead[front - row - length + 1], create(idx, front - length + 1, col)))
+                    front += 1
+
+        return successors
+
+    def _createSuccessorState(self, vehicle_idx, new_row, new_col):
+        # The child shares everything with its parent except the moved vehicle
+        old = self.vehicles[vehicle_idx]
+        # Bypass __init__: every attribute is set right below
+        new_puzzle = RushHourPuzzle.__new__(RushHourPuzzle)
+        new_puzzle.board_height = self.board_height
+        new_puzzle.board_width = self.board_width
+        new_puzzle.walls = self.walls
+
+        new_puzzle.vehicles = self.vehicles.copy()
+        new_puzzle.vehicles[vehicle_idx] = old.moved(new_row, new_col)
+
+        new_puzzle.moves = self.moves
+        new_puzzle.heuristic_cache = self.heuristic_cache
+        # Only the moved vehicle's key changes
+        new_puzzle.zobrist = keys = self.zobrist
+        if self._hash is None:
+            new_puzzle._hash = None
+        elif old.orientation == "H":
+            new_puzzle._hash = self._hash ^ keys[vehicle_idx][old.col] ^ keys[vehicle_idx][new_col]
+        else:
+            new_puzzle._hash = self._hash ^ keys[vehicle_idx][old.row] ^ keys[vehicle_idx][new_row]
+
+        new_puzzle._board = self.board
+        new_puzzle._delta = (old, new_row, new_col)
+        return new_puzzle
+
+    def _applyDelta(self):
+        # Copy the parent's board and update only the cells the moved vehicle
+        # vacated and entered; untouched rows stay shared with the parent
+        old, new_row, new_col = self._delta
+        board = self._board.copy()
+        length = old.length
+
+        if old.orientation == "H":
+            row = board[old.row] = board[old.row].copy()
+            row[old.col:old.col + length] = "." * length
+            row[new_col:new_col + length] = [old.vid] * length
+        else:  # Vertical
+            col = old.col
+            for r in range(old.row, old.row + length):
+                if not new_row <= r < new_row + length:
+                    board[r] = board[r].copy()
+                    board[r][col] = "."
+            for r in range(new_row, new_row + length):
+                if not old.row <= r < old.row + length:
+                    board[r] = board[r].copy()
+                    board[r][col] = old.vid
+
+        self._board = board
+        self._delta = None
+
+    def __eq__(self, other):
+        if not isinstance(other, RushHourPuzzle):
+            return False
+
+        # Different hashes always mean different layouts
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+
+        # Check if vehicles are in the same positions
+        if len(self.vehicles) != len(other.vehicles):
+            return False
+
+        for v1, v2 in zip(self.vehicles, other.vehicles):
+            if (v1.vid != v2.vid or v1.row != v2.row or v1.col != v2.col or
+                v1.orientation != v2.orientation or v1.length != v2.length):
+                return False
+
+        return True
+
+    def __hash__(self):
+        # XOR of the Zobrist keys of every vehicle's position; successors update
+        # it in O(1) in _createSuccessorState, so this loop runs once per board
+        if self._hash is None:
+            keys = self._zobristKeys()
+            value = 0
+            for i, v in enumerate(self.vehicles):
+                value ^= keys[i][v.col if v.orientation == "H" else v.row]
+            self._hash = value
+        return self._hash
+
+    def _zobristKeys(self):
+        # keys[i][p] = key of vehicle i with its free coordinate (col or row) at p.
+        # Keys depend on the vehicle and cell, not on list order, so equal
+        # layouts hash the same in every puzzle and every process
+        if self.zobrist is None:
+            keys = []
+            for v in self.vehicles:
+                limit = self.board_width if v.orientation == "H" else self.board_height
+                vehicle_keys = []
+                for pos in range(limit - v.length + 1):
+                    row, col = (v.row, pos) if v.orientation == "H" else (pos, v.col)
+                    vehicle_keys.append(zobristKey(v.vid, v.orientation, v.length, row, col))
+                keys.append(vehicle_keys)
+            self.zobrist = keys
+        return self.zobrist
+
+    def _moveTable(self):
+        if self.moves is None:
+            self.moves = moveTable([v.vid for v in self.vehicles], [v.orientation for v in self.vehicles],
+                                   self.board_height, self.board_width)
+        return self.moves
+
+    def toBitboard(self, info=None):
+        # Compact copy of this state; info can be shared between puzzles with the same layout
+        from .bitboard import BoardInfo, BitboardState
+
+        if info is None:
+            info = BoardInfo(self)
+        layout = 0
+        for i, v in enumerate(self.vehicles):
+            pos = v.col if v.orientation == "H" else v.row
+            layout |= pos << info.shifts[i]
+        return BitboardState(info, layout)
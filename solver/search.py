@@ -0,0 +1,582 @@
+from collections import deque, OrderedDict
+import os
+import time
+import heapq
+
+from .move import Move
+from .node import Node, NodeTable, TableNode
+from .bitboard import BitboardState
+from .heuristics import stateHeuristic
+from .frontier import BucketQueue, DiskQueue, layoutsPerBudget, readSorted, subtractSorted, writeSorted
+
+INFINITY = float("inf")
+# best_g value of layouts AStar has expanded: below every g, so any child
+# reaching one again counts as a duplicate
+EXPANDED = -1
+
+
+def BFS(s, successorsFn, isGoal, stats=None):
+    # stats: optional SearchStats to fill in
+    start_time = time.time()
+    
+    Open = deque()
+    # Every state ever put in Open (frontier and expanded), for O(1) duplicate checks
+    Seen = set()
+    duplicates = 0
+
+    def finish(node):
+        elapsed = time.time() - start_time
+        if stats is not None:
+            stats.duplicates += duplicates
+            stats.frontier(len(Open), len(Seen))
+            stats.elapsed = elapsed
+        return node, elapsed
+
+    if stats is not None:
+        successorsFn = stats.successors(successorsFn)
+
+    init_node = Node(s, None, None)
+
+    if isGoal(init_node.state):
+        return finish(init_node)
+
+    Open.append(init_node)
+    Seen.add(init_node.state)
+
+    while Open:
+
+        current = Open.popleft()
+
+        for action, successor in successorsFn(current.state):
+            # Skip states already in the frontier or already expanded
+            if successor in Seen:
+                duplicates += 1
+                continue
+
+            child = Node(successor, current, action, 0)
+
+            # First check if this child is the goal state
+            if isGoal(child.state):
+                return finish(child)
+
+            Seen.add(child.state)
+            Open.append(child)
+
+        if stats is not None:
+            stats.frontier(len(Open), len(Seen))
+    
+    return finish(None)
+
+
+def AStar(s, successorsFn, isGoal, h, stats=None, open_list="heap", tie_break="lifo"):
+    # Searches over bitboard layouts whatever the type of s: nodes live in a
+    # NodeTable (parent index, packed move, g and f per node) plus the layout
+    # of each node, and the result is a TableNode that decodes its actions and
+    # rebuilds its path, in the type of s, on demand. Open holds node indexes
+    # only; the state of a node is rebuilt from its layout when it is popped.
+    # best_g maps every layout on Open to the lowest g it was pushed with, and
+    # every expanded layout to EXPANDED, so a child reached again with an
+    # equal or worse g (or already expanded) is not pushed at all; the entries
+    # a better g leaves behind are skipped when popped (lazy invalidation).
+    # Children with an infinite h can never reach a goal and are not pushed
+    # either.
+    # open_list="heap": a binary heap of (f, -index), ties between equal f
+    # going to the newest node. open_list="bucket": a BucketQueue (h must
+    # return integers), with tie_break "lifo" or "h" inside each f
+    # h is evaluated on bitboard states (see heuristics.stateHeuristic)
+    # stats: optional SearchStats to fill in, including Open pushes and pops
+    start_time = time.time()
+    h = stateHeuristic(h)
+    start = s if isinstance(s, BitboardState) else s.toBitboard()
+    info = start.info
+
+    best_g = {}
+    table = NodeTable()
+    layouts = []
+    expanded = 0
+    duplicates = 0
+    pushes = 0
+    pops = 0
+
+    if open_list == "bucket":
+        Open = BucketQueue(tie_break)
+
+        def push(f, h_value, index):
+            Open.push(f, h_value, index)
+
+        def pop():
+            return Open.pop()[1]
+    elif open_list == "heap":
+        Open = []
+
+        def push(f, h_value, index):
+            heapq.heappush(Open, (f, -index))
+
+        def pop():
+            return -heapq.heappop(Open)[1]
+    else:
+        raise ValueError(f"unknown open_list {open_list!r}")
+
+    def add(parent, action, g, f, layout):
+        layouts.append(layout)
+        return table.add(parent, action, g, f)
+
+    def finish(node):
+        elapsed = time.time() - start_time
+        if stats is not None:
+            stats.duplicates += duplicates
+            stats.pushes += pushes
+            stats.pops += pops
+            stats.frontier(len(Open), expanded)
+            stats.elapsed = elapsed
+        return node, elapsed
+
+    if stats is not None:
+        successorsFn = stats.successors(successorsFn)
+        h = stats.heuristic(h)
+    
+    # Initialize the start node
+    start_h = h(start)
+    if start_h == INFINITY:
+        return finish(None)
+    push(start_h, start_h, add(-1, None, 0, start_h, start.layout))
+    best_g[start.layout] = 0
+    pushes += 1
+    
+    while Open:
+        # Get node with lowest f value
+        index = pop()
+        pops += 1
+        layout = layouts[index]
+        
+        # Skip entries superseded by a better g, and layouts already expanded
+        if best_g[layout] != table.g[index]:
+            duplicates += 1
+            continue
+
+        state = BitboardState(info, layout)
+        if isGoal(state):
+            return finish(TableNode(table, index, s, state if s is start else state.toPuzzle()))
+        
+        best_g[layout] = EXPANDED
+        expanded += 1
+        child_g = table.g[index] + 1
+        
+        for action, child in successorsFn(state):
+            # Skip if already expanded or already on Open with a g as good
+            child_layout = child.layout
+            if best_g.get(child_layout, child_g + 1) <= child_g:
+                duplicates += 1
+                continue
+
+            child_h = h(child)
+            if child_h == INFINITY:
+                continue
+            best_g[child_layout] = child_g
+            child_f = child_g + child_h
+            push(child_f, child_h, add(index, action, child_g, child_f, child_layout))
+            pushes += 1
+
+        if stats is not None:
+            stats.frontier(len(Open), expanded)
+    
+    return finish(None)
+
+
+def IDAStar(s, successorsFn, isGoal, h, table_size=100000, stats=None):
+    # Iterative-deepening A*: depth-first searches bounded by f = g + h, each
+    # iteration raising the bound to the smallest f that went over it. Optimal
+    # when h is admissible. Memory is the current path plus a transposition
+    # table of at most table_size states (least recently used evicted first).
+    # An entry [iteration, g, h] holds:
+    # - the last iteration the state was expanded in (0: only generated so
+    #   far) and the smallest g it was expanded with there: reaching it again
+    #   with a g that is not smaller cannot find anything new
+    # - a backed-up heuristic, the smallest f found below the state minus its g,
+    #   which stays admissible and prunes failed subtrees in later iterations
+    # Once nothing has been evicted and every state in the table has been
+    # expanded, the table is the whole reachable space: without a goal in it
+    # the search stops, whatever the bound.
+    # stats: optional SearchStats to fill in; Open is the current path and
+    # Closed the transposition table
+    start_time = time.time()
+    h = stateHeuristic(h)
+    infinity = float('inf')
+    duplicates = 0
+    table = OrderedDict()
+    # Entries never expanded, and whether the table has lost any entry
+    unexpanded = 0
+    complete = True
+
+    def insert(state, entry):
+        # Add an entry, evicting the least recently used one past table_size
+        nonlocal unexpanded, complete
+        table[state] = entry
+        unexpanded += not entry[0]
+        if len(table) > table_size:
+            _, evicted = table.popitem(last=False)
+            unexpanded -= not evicted[0]
+            complete = False
+
+    def finish(node):
+        elapsed = time.time() - start_time
+        if stats is not None:
+            stats.duplicates += duplicates
+            stats.frontier(0, len(table))
+            stats.elapsed = elapsed
+        return node, elapsed
+
+    if stats is not None:
+        successorsFn = stats.successors(successorsFn)
+        h = stats.heuristic(h)
+
+    root = Node(s, None, None, 0)
+    if isGoal(root.state):
+        return finish(root)
+    root.f = bound = h(root.state)
+    # Kept here as well as in the table: the table may evict it, and its
+    # backed-up h tightens the bound of every state with a move back to it
+    root_entry = [0, 0, root.f]
+    iteration = 0
+
+    while bound != infinity:
+        iteration += 1
+        root_entry[0] = iteration
+        table.pop(root.state, None)
+        insert(root.state, root_entry)
+        on_path = {root.state}
+        # frame = [node, remaining children, smallest f seen below node]
+        stack = [[root, iter(successorsFn(root.state)), infinity]]
+        next_bound = infinity
+
+        while stack:
+            frame = stack[-1]
+            node = frame[0]
+            for action, child_state in frame[1]:
+                child_g = node.g + 1
+                entry = table.get(child_state)
+                # Duplicates first: a cycle back onto the path, or a state
+                # already expanded in this iteration with a g at least as small,
+                # cannot lead anywhere new, so its f does not raise the bound
+                if child_state in on_path:
+                    duplicates += 1
+                    frame[2] = min(frame[2], child_g + (h(child_state) if entry is None else entry[2]))
+                    continue
+                if entry is None:
+                    child_h = h(child_state)
+                    entry = [0, infinity, child_h]
+                    insert(child_state, entry)
+                else:
+                    child_h = entry[2]
+                child_f = child_g + child_h
+
+                if entry[0] == iteration and entry[1] <= child_g:
+                    duplicates += 1
+                    frame[2] = min(frame[2], child_f)
+                    continue
+                if child_f > bound:
+                    next_bound = min(next_bound, child_f)
+                    frame[2] = min(frame[2], child_f)
+                    continue
+
+                child = Node(child_state, node, action, child_g, child_f)
+                if isGoal(child_state):
+                    return finish(child)
+
+                if child_state in table:
+                    unexpanded -= not entry[0]
+                    entry[0], entry[1] = iteration, child_g
+                    table.move_to_end(child_state)
+
+                on_path.add(child_state)
+                stack.append([child, iter(successorsFn(child_state)), infinity])
+                if stats is not None:
+                    stats.frontier(len(stack), len(table))
+                break
+            else:
+                # Every child done: back up the bound and backtrack
+                stack.pop()
+                on_path.discard(node.state)
+                backed_h = frame[2] - node.g
+                entry = root_entry if node is root else table.get(node.state)
+                if entry is not None:
+                    backed_h = entry[2] = max(entry[2], backed_h)
+                if stack:
+                    stack[-1][2] = min(stack[-1][2], node.g + backed_h)
+
+        if complete and not unexpanded:
+            break
+        bound = next_bound
+
+    return finish(None)
+
+REVERSE_DIRECTION = {"left": "right", "right": "left", "up": "down", "down": "up"}
+
+
+def reverseAction(action):
+    # "Move A left 2" undoes "Move A right 2" (a Move for a Move, text for text)
+    if isinstance(action, Move):
+        return Move(action.vid, REVERSE_DIRECTION[action.direction], action.distance)
+    word, vid, direction, amount = action.split(" ")
+    return f"{word} {vid} {REVERSE_DIRECTION[direction]} {amount}"
+
+
+def _expandLayer(frontier, visited, other, successorsFn):
+    # Expand one full BFS layer; stops at the first child the other side has seen.
+    # Also returns how many children were already visited
+    next_frontier = []
+    duplicates = 0
+    for state in frontier:
+        for action, child in successorsFn(state):
+            if child.layout in visited:
+                duplicates += 1
+                continue
+            visited[child.layout] = (state.layout, action)
+            if child.layout in other:
+                return next_frontier, child.layout, duplicates
+            next_frontier.append(child)
+    return next_frontier, None, duplicates
+
+
+def _finishBidirectional(node, start_time, stats):
+    elapsed = time.time() - start_time
+    if stats is not None:
+        stats.elapsed = elapsed
+    return node, elapsed
+
+
+def reachesExit(state):
+    # The standard goal test, X at the exit (solve.isGoal). BidirectionalBFS
+    # can only enumerate the goal layouts of this test
+    return state.isGoal()
+
+
+# Most goal layouts BidirectionalBFS seeds its backward search with; boards
+# with more (much free space, many vehicles) are solved by a plain BFS
+GOAL_LIMIT = 25000
+
+
+def BidirectionalBFS(s, successorsFn, isGoal, stats=None):
+    # Breadth-first search grown from the start and, backwards, from every goal
+    # layout at once; each step expands a whole layer of the smaller frontier.
+    # Moves are reversible, so the backward search uses the same successors.
+    # The first layout reached by both sides lies on a shortest solution: no
+    # earlier meeting means the solution is longer than both depths combined.
+    # Goal layouts are only known for reachesExit: any other isGoal is
+    # searched with a plain BFS
+    # stats: optional SearchStats to fill in; Open is both frontiers, Closed
+    # both visited maps
+    if isGoal is not reachesExit:
+        return BFS(s, successorsFn, isGoal, stats=stats)
+
+    start_time = time.time()
+    start = s if isinstance(s, BitboardState) else s.toBitboard()
+    info = start.info
+    if start.isGoal():
+        return _finishBidirectional(Node(s, None, None), start_time, stats)
+
+    goals = info.goalLayouts(start.layout, GOAL_LIMIT)
+    if goals is None:
+        node, _ = BFS(s, successorsFn, isGoal, stats=stats)
+        return _finishBidirectional(node, start_time, stats)
+
+    if stats is not None:
+        successorsFn = stats.successors(successorsFn)
+
+    # layout -> (neighbour layout, action) used for path reconstruction
+    forward = {start.layout: None}
+    backward = dict.fromkeys(goals)
+
+    forward_frontier = [start]
+    backward_frontier = [BitboardState(info, layout) for layout in backward]
+    meet = None
+
+    while forward_frontier and backward_frontier and meet is None:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meet, duplicates = _expandLayer(forward_frontier, forward, backward, successorsFn)
+        else:
+            backward_frontier, meet, duplicates = _expandLayer(backward_frontier, backward, forward, successorsFn)
+        if stats is not None:
+            stats.duplicates += duplicates
+            stats.frontier(len(forward_frontier) + len(backward_frontier), len(forward) + len(backward))
+
+    if meet is None:
+        return _finishBidirectional(None, start_time, stats)
+
+    # start ... meet, following forward parents
+    steps = []
+    layout = meet
+    while forward[layout] is not None:
+        parent, action = forward[layout]
+        steps.append((layout, action))
+        layout = parent
+    steps.reverse()
+    # meet ... goal; backward links point towards the goal with the move
+    # that led away from it, so each one is reversed
+    layout = meet
+    while backward[layout] is not None:
+        toward_goal, action = backward[layout]
+        steps.append((toward_goal, reverseAction(action)))
+        layout = toward_goal
+
+    # Same state type as the caller passed in
+    node = Node(s, None, None)
+    for layout, action in steps:
+        state = BitboardState(info, layout)
+        if not isinstance(s, BitboardState):
+            state = state.toPuzzle()
+        node = Node(state, node, action, node.g + 1)
+    return _finishBidirectional(node, start_time, stats)
+
+
+def _layoutPath(s, info, path, successorsFn):
+    # Node chain for the layouts path[0] (the start s) ... path[-1], in the same
+    # state type as s; each action is found by regenerating the previous
+    # layout's moves
+    node = Node(s, None, None)
+    for parent, layout in zip(path, path[1:]):
+        action, state = next((action, child) for action, child in successorsFn(BitboardState(info, parent))
+                             if child.layout == layout)
+        if not isinstance(s, BitboardState):
+            state = state.toPuzzle()
+        node = Node(state, node, action, node.g + 1)
+    return node
+
+
+# Frontier memory of DiskFrontierBFS before layouts spill to disk
+FRONTIER_BUDGET = 256 * 1024 * 1024
+
+
+def DiskFrontierBFS(s, successorsFn, isGoal, memory_budget=FRONTIER_BUDGET, stats=None):
+    # Breadth-first search for large boards. States are bitboard layouts (plain
+    # integers) rather than Nodes, every visited layout maps to its parent
+    # layout only, and the frontier is a DiskQueue holding at most
+    # memory_budget bytes of layouts in memory. Actions are recovered at the
+    # end by regenerating each parent's moves along the solution path
+    # stats: optional SearchStats to fill in
+    start_time = time.time()
+    expand = successorsFn
+    if stats is not None:
+        successorsFn = stats.successors(successorsFn)
+
+    start = s if isinstance(s, BitboardState) else s.toBitboard()
+    info = start.info
+    parents = {start.layout: None}
+    duplicates = 0
+    goal = start.layout if isGoal(start) else None
+
+    with DiskQueue(info.layout_bytes, layoutsPerBudget(info, memory_budget)) as Open:
+        Open.append(start.layout)
+        while Open and goal is None:
+            layout = Open.popleft()
+            for _, child in successorsFn(BitboardState(info, layout)):
+                if child.layout in parents:
+                    duplicates += 1
+                    continue
+                parents[child.layout] = layout
+                if isGoal(child):
+                    goal = child.layout
+                    break
+                Open.append(child.layout)
+            if stats is not None:
+                stats.frontier(len(Open), len(parents))
+
+    node = None
+    if goal is not None:
+        path = [goal]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
+        node = _layoutPath(s, info, path, expand)
+
+    elapsed = time.time() - start_time
+    if stats is not None:
+        stats.duplicates += duplicates
+        stats.elapsed = elapsed
+    return node, elapsed
+
+
+def ExternalBFS(s, successorsFn, isGoal, memory_budget=FRONTIER_BUDGET, directory=None, stats=None):
+    # External-memory breadth-first search with delayed duplicate detection,
+    # for state spaces larger than RAM. Every layer is a file of sorted,
+    # distinct packed layouts. The children of a layer are buffered up to
+    # memory_budget bytes, sorted and written out as runs; the runs are then
+    # merged and anything already in the two previous layers is dropped (moves
+    # are reversible, so a child of layer d lies in layer d-1, d or d+1). The
+    # solution is rebuilt by walking back through the layer files.
+    # directory: where the layer files go (default: the system temporary
+    # directory, which should be on local disk)
+    # stats: optional SearchStats to fill in; Open is the largest layer and
+    # Closed every layout written to disk
+    start_time = time.time()
+    expand = successorsFn
+    if stats is not None:
+        successorsFn = stats.successors(successorsFn)
+
+    start = s if isinstance(s, BitboardState) else s.toBitboard()
+    info = start.info
+    size = info.layout_bytes
+    buffer_items = layoutsPerBudget(info, memory_budget)
+    goal = start.layout if isGoal(start) else None
+    duplicates = 0
+    stored = 1
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="rushhour-bfs-", dir=directory) as work:
+        layers = [os.path.join(work, "layer-0")]
+        writeSorted(layers[0], [start.layout], size)
+        count = 1
+        while count and goal is None:
+            runs = []
+            buffer = []
+            generated = 0
+            for layout in readSorted(layers[-1], size):
+                for _, child in successorsFn(BitboardState(info, layout)):
+                    if isGoal(child):
+                        goal = child.layout
+                        break
+                    buffer.append(child.layout)
+                    if len(buffer) >= buffer_items:
+                        runs.append(os.path.join(work, f"run-{len(runs)}"))
+                        generated += len(buffer)
+                        writeSorted(runs[-1], sorted(buffer), size)
+                        buffer = []
+                if goal is not None:
+                    break
+            if goal is not None:
+                break
+
+            # Merge the sorted runs (the last one still in memory) and drop
+            # what the previous two layers already hold
+            generated += len(buffer)
+            buffer.sort()
+            merged = heapq.merge(*(readSorted(run, size) for run in runs), buffer)
+            new = subtractSorted(merged, *(readSorted(layer, size) for layer in layers[-2:]))
+            layers.append(os.path.join(work, f"layer-{len(layers)}"))
+            count = writeSorted(layers[-1], new, size)
+            for run in runs:
+                os.remove(run)
+
+            duplicates += generated - count
+            stored += count
+            if stats is not None:
+                stats.frontier(count, stored)
+
+        node = None
+        if goal is not None:
+            # Back through the layers: some layout of each one is a neighbour
+            # of the step after it
+            path = [goal]
+            if goal != start.layout:
+                for layer in reversed(layers):
+                    neighbours = {child.layout for _, child in expand(BitboardState(info, path[-1]))}
+                    path.append(next(layout for layout in readSorted(layer, size) if layout in neighbours))
+            path.reverse()
+            node = _layoutPath(s, info, path, expand)
+
+    elapsed = time.time() - start_time
+    if stats is not None:
+        stats.duplicates += duplicates
+        stats.elapsed = elapsed
+    return node, elapsed
@@ -0,0 +1,251 @@
+import time
+from importlib.util import find_spec
+
+from .node import Node
+from .search import BFS, AStar, BidirectionalBFS, DiskFrontierBFS, ExternalBFS, IDAStar, reachesExit
+from .parallel import ParallelBFS
+from .heuristics import h1, h2, h3, h4
+from .pdb import PatternDatabase
+from .stats import SearchStats
+from .vectorized import VectorBFS
+
+
+def successors(state):
+    return state.successorFunction()
+
+
+# X at the exit; BidirectionalBFS recognises this test and enumerates its goals
+isGoal = reachesExit
+
+
+def patternDatabaseAStar(puzzle, successorsFn, stats=None):
+    # The table is built (or loaded from the cache) first; that time is included
+    start_time = time.time()
+    solution, _ = AStar(puzzle, successorsFn, isGoal, PatternDatabase(puzzle), stats=stats)
+    elapsed = time.time() - start_time
+    if stats is not None:
+        stats.elapsed = elapsed
+    return solution, elapsed
+
+
+# Every algorithm solve_with_all_algorithms compares, by display name.
+# Each entry is called as fn(puzzle, successorsFn, stats=None) and returns
+# (solution node, elapsed time); stats is an optional SearchStats to fill in
+ALGORITHMS = {
+    "BFS": lambda puzzle, successorsFn, stats=None: BFS(puzzle, successorsFn, isGoal, stats=stats),
+    "A* (h1)": lambda puzzle, successorsFn, stats=None: AStar(puzzle, successorsFn, isGoal, h1, stats=stats),
+    "A* (h2)": lambda puzzle, successorsFn, stats=None: AStar(puzzle, successorsFn, isGoal, h2, stats=stats),
+    "A* (h3)": lambda puzzle, successorsFn, stats=None: AStar(puzzle, successorsFn, isGoal, h3, stats=stats),
+    "A* (h4)": lambda puzzle, successorsFn, stats=None: AStar(puzzle, successorsFn, isGoal, h4, stats=stats),
+    "A* (PDB)": patternDatabaseAStar,
+    "Bidirectional BFS": lambda puzzle, successorsFn, stats=None: BidirectionalBFS(puzzle, successorsFn, isGoal,
+                                                                                   stats=stats),
+    "BFS (disk frontier)": lambda puzzle, successorsFn, stats=None: DiskFrontierBFS(puzzle, successorsFn, isGoal,
+                                                                                    stats=stats),
+    "BFS (external memory)": lambda puzzle, successorsFn, stats=None: ExternalBFS(puzzle, successorsFn, isGoal,
+                                                                                  stats=stats),
+    "BFS (parallel)": lambda puzzle, successorsFn, stats=None: ParallelBFS(puzzle, successorsFn, isGoal, stats=stats),
+    "IDA* (h2)": lambda puzzle, successorsFn, stats=None: IDAStar(puzzle, successorsFn, isGoal, h2, stats=stats),
+    "IDA* (h4)": lambda puzzle, successorsFn, stats=None: IDAStar(puzzle, successorsFn, isGoal, h4, stats=stats),
+}
+
+# Algorithms guaranteed to return a shortest solution. h1-h3 count cells to the
+# exit while sliding several cells is a single move, so A* with them can overshoot;
+# h4 and the pattern database count moves and are admissible
+OPTIMAL_ALGORITHMS = {"BFS", "Bidirectional BFS", "BFS (disk frontier)",
+                      "BFS (external memory)", "BFS (parallel)", "A* (h4)", "A* (PDB)", "IDA* (h4)"}
+
+# What the pygame visualizers solve and animate: the quick searches, while
+# the disk-based, parallel, IDA* and pattern database runs take seconds to
+# tens of seconds on the larger boards
+VISUALIZER_ALGORITHMS = ["BFS", "A* (h1)", "A* (h2)", "A* (h3)", "A* (h4)"]
+
+# NumPy is optional: the vectorized BFS is offered only where it is installed
+if find_spec("numpy") is not None:
+    ALGORITHMS["BFS (NumPy)"] = lambda puzzle, successorsFn, stats=None: VectorBFS(puzzle, stats=stats)
+    OPTIMAL_ALGORITHMS.add("BFS (NumPy)")
+
+
+# Timing one expansion in STATS_SAMPLE keeps the instrumentation overhead low
+STATS_SAMPLE = 64
+
+
+def runAlgorithm(name, puzzle, sample=STATS_SAMPLE):
+    # Run one registered algorithm; also returns its SearchStats
+    stats = SearchStats(sample)
+    solution, elapsed = ALGORITHMS[name](puzzle, successors, stats=stats)
+    return solution, elapsed, stats
+
+
+def _solutionEntry(solution, elapsed, stats):
+    # solutions[name] of solve_with_all_algorithms: the stats dict is what the
+    # visualizers' info panel shows; "search" keeps the full SearchStats
+    return {
+        "solution": solution,
+        "stats": {
+            "Execution Time": f"{elapsed:.4f}s",
+            "Solution Cost": len(solution.getSolution()),
+            **stats.summary()
+        },
+        "search": stats
+    }
+
+
+def replaySolution(puzzle, actions):
+    # Node chain for a list of action strings applied from puzzle
+    node = Node(puzzle)
+    for action in actions:
+        for child_action, child_state in node.state.successorFunction():
+            if str(child_action) == action:
+                node = Node(child_state, node, child_action, node.g + 1)
+                break
+        else:
+            raise ValueError(f"{action} is not a legal move")
+    return node
+
+
+def solve_with_all_algorithms(puzzle, bitboard=False, parallel=False, first=False, cache=None, algorithms=None):
+    #solve the puzzle with all algorithms and return solutions with stats
+    # bitboard=True searches over compact BitboardState objects instead of full puzzles
+    # parallel=True runs the algorithms at the same time (see solve_portfolio)
+    # cache (a SolutionCache) answers boards solved before without searching and
+    # remembers the first optimal solution found otherwise
+    # algorithms: names of the ALGORITHMS to run (default: all of them)
+    if bitboard:
+        puzzle = puzzle.toBitboard()
+
+    if cache is not None:
+        start_time = time.time()
+        actions = cache.get(puzzle)
+        if actions is not None:
+            return {"Cache": {
+                "solution": replaySolution(puzzle, actions),
+                "stats": {
+                    "Execution Time": f"{time.time() - start_time:.4f}s",
+                    "Solution Cost": len(actions)
+                }
+            }}
+
+    if parallel or first:
+        solutions = solve_portfolio(puzzle, first=first, algorithms=algorithms)
+    else:
+        solutions = {}
+
+        for name in algorithms or ALGORITHMS:
+            print(f"Solving with {name}...")
+            solution, elapsed, stats = runAlgorithm(name, puzzle)
+
+            if solution:
+                solutions[name] = _solutionEntry(solution, elapsed, stats)
+
+    if cache is not None:
+        for name in solutions:
+            if name in OPTIMAL_ALGORITHMS:
+                cache.put(puzzle, solutions[name]["solution"].getSolution())
+                break
+    return solutions
+
+
+def _portfolioWorker(name, fn, puzzle, results):
+    # Runs in a child process; fn is None for a registered algorithm. Sends the
+    # path as flat lists: a deep Node chain could hit the recursion limit while
+    # being pickled
+    try:
+        if fn is None:
+            solution, elapsed, stats = runAlgorithm(name, puzzle)
+        else:
+            stats = SearchStats(STATS_SAMPLE)
+            solution, elapsed = fn(puzzle, successors, stats=stats)
+        if solution is None:
+            results.put((name, None, None, elapsed, stats, None))
+        else:
+            results.put((name, solution.getPath(), solution.getSolution(), elapsed, stats, None))
+    except Exception as exc:
+        results.put((name, None, None, 0.0, None, f"{type(exc).__name__}: {exc}"))
+
+
+def _rebuildNode(path, actions):
+    node = Node(path[0])
+    for state, action in zip(path[1:], actions):
+        node = Node(state, node, action, node.g + 1)
+    return node
+
+
+# Default time limit of solve_portfolio, in seconds, and how often it checks
+# that the workers it is still waiting for are alive
+PORTFOLIO_TIMEOUT = 120
+PORTFOLIO_POLL = 0.5
+
+
+def solve_portfolio(puzzle, first=False, algorithms=None, timeout=PORTFOLIO_TIMEOUT):
+    # Run several algorithms at once, one process each, so the latency is the
+    # slowest run instead of the sum of all of them.
+    # first=False collects every result (same output as solve_with_all_algorithms).
+    # first=True returns as soon as one algorithm answers and stops the others;
+    # by default only the OPTIMAL_ALGORITHMS take part so the answer is optimal.
+    # algorithms: names from ALGORITHMS, or a dict of name -> function called
+    # like the ALGORITHMS entries (None for the registered one); where
+    # processes are spawned rather than forked those functions must be
+    # picklable (defined at module level).
+    # timeout: seconds to wait for the results (None: no limit); the algorithms
+    # still running then are stopped. Workers that die without a result are
+    # given up on as well
+    if algorithms is None:
+        algorithms = [name for name in ALGORITHMS if not first or name in OPTIMAL_ALGORITHMS]
+    import multiprocessing
+    import queue
+
+    functions = algorithms if isinstance(algorithms, dict) else dict.fromkeys(algorithms)
+    algorithms = list(functions)
+
+    results = multiprocessing.Queue()
+    processes = {}
+    for name, fn in functions.items():
+        process = multiprocessing.Process(target=_portfolioWorker, args=(name, fn, puzzle, results), daemon=True)
+        process.start()
+        processes[name] = process
+    print(f"Solving with {', '.join(algorithms)} in parallel...")
+
+    solutions = {}
+    pending = set(algorithms)
+    deadline = None if timeout is None else time.time() + timeout
+    # Set when every pending worker has exited: a worker posts its result
+    # before exiting, so one more poll collects anything still in transit
+    stalled = False
+    try:
+        while pending:
+            remaining = PORTFOLIO_POLL if deadline is None else min(PORTFOLIO_POLL, deadline - time.time())
+            if remaining <= 0:
+                print(f"Portfolio timed out waiting for {', '.join(sorted(pending))}")
+                break
+            try:
+                name, path, actions, elapsed, stats, error = results.get(timeout=remaining)
+            except queue.Empty:
+                if any(processes[name].is_alive() for name in pending):
+                    continue
+                if stalled:
+                    print(f"{', '.join(sorted(pending))} exited without a result")
+                    break
+                stalled = True
+                continue
+
+            pending.discard(name)
+            if error:
+                print(f"{name} failed: {error}")
+                continue
+            print(f"{name} finished in {elapsed:.4f}s")
+            if path is None:
+                continue
+
+            solutions[name] = _solutionEntry(_rebuildNode(path, actions), elapsed, stats)
+            if first:
+                break
+    finally:
+        # Cancel whatever is still running
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+    # Same order as the serial comparison
+    return {name: solutions[name] for name in algorithms if name in solutions}
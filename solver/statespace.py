@@ -0,0 +1,217 @@
+# Offline enumeration of every configuration reachable from a puzzle, with the
+# exact number of moves left from each one (retrograde BFS from the goal set).
+# The result is saved as a memory-mapped index, after which the optimal next
+# move and the remaining distance of any reachable state are lookups.
+#
+#   python -m solver.statespace PUZZLES... [--cache-dir DIR] [--cache-mb MB]
+#
+# Index file: b"RHSS", version, state count, then the sorted 64-bit layouts
+# (BitboardState packing) and the uint16 distance of each one.
+import argparse
+import bisect
+import mmap
+import os
+import struct
+import time
+from array import array
+from collections import deque
+
+from .bitboard import BoardInfo, BitboardState
+from .cachefiles import CACHE_BYTES, defaultCacheDir, evictFiles, touch, writeAtomic
+from .puzzle import RushHourPuzzle, zobristKey
+
+MAGIC = b"RHSS"
+VERSION = 1
+HEADER = struct.Struct("<4sIQ")
+# Distance stored for states that cannot reach a goal
+UNSOLVABLE = 0xFFFF
+
+
+def neighbours(info, layout, occupied):
+    # Layouts one move away, with their occupancy (same moves as BitboardState)
+    for idx, masks in enumerate(info.masks):
+        shift = info.shifts[idx]
+        pos = (layout >> shift) & info.pos_mask
+        free = occupied & ~masks[pos]
+        for new_pos in range(pos - 1, -1, -1):
+            if free & masks[new_pos]:
+                break
+            yield layout - ((pos - new_pos) << shift), free | masks[new_pos]
+        for new_pos in range(pos + 1, len(masks)):
+            if free & masks[new_pos]:
+                break
+            yield layout + ((new_pos - pos) << shift), free | masks[new_pos]
+
+
+def goalDistances(info, start, max_states=None):
+    # Every layout of start's connected component, and the distance to the
+    # nearest goal of those that can reach one. Returns None when the component
+    # has more than max_states layouts
+    x = info.x_index
+    goal_pos = None
+    if x is not None and info.orientations[x] == "H":
+        goal_pos = info.board_width - info.lengths[x]
+
+    # Forward BFS: the connected component of the start
+    start_occupied = info.occupancy(start)
+    seen = {start}
+    queue = deque([(start, start_occupied)])
+    goals = []
+    while queue:
+        layout, occupied = queue.popleft()
+        if goal_pos is not None and (layout >> info.shifts[x]) & info.pos_mask == goal_pos:
+            goals.append((layout, occupied))
+        for child, child_occupied in neighbours(info, layout, occupied):
+            if child not in seen:
+                seen.add(child)
+                queue.append((child, child_occupied))
+        if max_states is not None and len(seen) > max_states:
+            return None
+
+    # Retrograde BFS from every goal (moves are reversible)
+    distance = {layout: 0 for layout, _ in goals}
+    queue = deque(goals)
+    while queue:
+        layout, occupied = queue.popleft()
+        d = distance[layout] + 1
+        for child, child_occupied in neighbours(info, layout, occupied):
+            if child not in distance:
+                distance[child] = d
+                queue.append((child, child_occupied))
+    return seen, distance
+
+
+class StateSpace:
+    # Every state reachable from puzzle and its distance to the nearest goal.
+    # Built once per puzzle and cached under cache_dir; the file name is derived
+    # from the board size, the walls and the starting vehicles. cache_bytes caps
+    # the directory: once a new index is written, the least recently used ones
+    # are deleted until it fits.
+    def __init__(self, puzzle, cache_dir=None, cache_bytes=CACHE_BYTES):
+        self.cache_dir = cache_dir or defaultCacheDir("statespace")
+        self.cache_bytes = cache_bytes
+        self.info = BoardInfo(puzzle)
+        start = puzzle if isinstance(puzzle, BitboardState) else puzzle.toBitboard(self.info)
+        self.start = start.layout
+        if len(self.info.vids) * self.info.pos_bits > 64:
+            raise ValueError("layouts of this puzzle do not fit in 64 bits")
+
+        vehicles = tuple((v.vid, v.orientation, v.length, v.row, v.col) for v in puzzle.vehicles)
+        key = zobristKey(self.info.board_height, self.info.board_width,
+                         tuple(sorted(self.info.walls)), vehicles)
+        self.path = os.path.join(self.cache_dir, f"{key:016x}.rhss")
+        self.keys, self.distances = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            keys, distances = self._enumerate()
+            writeAtomic(self.path, HEADER.pack(MAGIC, VERSION, len(keys)), keys, distances)
+            evictFiles(self.cache_dir, ".rhss", self.cache_bytes, keep=self.path)
+        else:
+            touch(self.path)
+
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} state space index")
+        view = memoryview(self._mmap)
+        start = HEADER.size
+        keys = view[start:start + 8 * count].cast("Q")
+        distances = view[start + 8 * count:start + 10 * count].cast("H")
+        return keys, distances
+
+    def _enumerate(self):
+        seen, distance = goalDistances(self.info, self.start)
+        keys = array("Q", sorted(seen))
+        distances = array("H", (distance.get(layout, UNSOLVABLE) for layout in keys))
+        return keys, distances
+
+    def _layout(self, state):
+        if isinstance(state, BitboardState):
+            return state.layout
+        return state.toBitboard(self.info).layout
+
+    def _find(self, layout):
+        i = bisect.bisect_left(self.keys, layout)
+        if i < len(self.keys) and self.keys[i] == layout:
+            return i
+        return None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, state):
+        return self._find(self._layout(state)) is not None
+
+    def distance(self, state):
+        # Moves left from state on an optimal path; None if it is not reachable
+        # from the start or cannot reach a goal
+        i = self._find(self._layout(state))
+        if i is None or self.distances[i] == UNSOLVABLE:
+            return None
+        return self.distances[i]
+
+    def nextMove(self, state):
+        # (action, child) one step closer to the goal, or None at a goal or a dead end
+        d = self.distance(state)
+        if not d:
+            return None
+        if not isinstance(state, BitboardState):
+            state = state.toBitboard(self.info)
+        for action, child in state.successorFunction():
+            if self.distance(child) == d - 1:
+                return action, child
+        return None
+
+    def solution(self, state):
+        # Actions of an optimal solution from state (None if there is none)
+        if self.distance(state) is None:
+            return None
+        actions = []
+        step = self.nextMove(state)
+        while step is not None:
+            action, state = step
+            actions.append(str(action))
+            step = self.nextMove(state)
+        return actions
+
+    def stats(self):
+        histogram = {}
+        for d in self.distances:
+            histogram[d] = histogram.get(d, 0) + 1
+        unsolvable = histogram.pop(UNSOLVABLE, 0)
+        return {
+            "states": len(self.keys),
+            "goals": histogram.get(0, 0),
+            "unsolvable": unsolvable,
+            "start distance": self.distance(BitboardState(self.info, self.start)),
+            "max distance": max(histogram) if histogram else None,
+            "distance histogram": dict(sorted(histogram.items())),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enumerate the reachable state space of Rush Hour puzzles")
+    parser.add_argument("puzzles", nargs="+", help="puzzle CSV files")
+    parser.add_argument("--cache-dir", default=None, help=f"index directory (default: {defaultCacheDir('statespace')})")
+    parser.add_argument("--cache-mb", type=int, default=CACHE_BYTES >> 20,
+                        help="size limit of the index directory; least recently used indexes are deleted")
+    args = parser.parse_args(argv)
+
+    for filename in args.puzzles:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(filename)
+        puzzle.setBoard()
+
+        start = time.perf_counter()
+        space = StateSpace(puzzle, args.cache_dir, args.cache_mb << 20)
+        elapsed = time.perf_counter() - start
+        stats = space.stats()
+        print(f"{filename}: {stats['states']} states, {stats['goals']} goals, "
+              f"{stats['unsolvable']} unsolvable, start distance {stats['start distance']}, "
+              f"max distance {stats['max distance']} ({elapsed:.2f}s, {space.path})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import time
+
+
+class SearchStats:
+    # Filled in by a search given stats=SearchStats(): node counts, frontier
+    # peaks and time spent generating successors and evaluating the
+    # heuristic. Hashing has no timer of its own: states hash incrementally
+    # (Zobrist keys updated while a child is created, or the bitboard layout
+    # integer), so its cost is part of successor_time.
+    #
+    # Counters are always exact. Timers cost two clock reads per call, so with
+    # sample=N only one expansion out of N is timed (its successors, then the
+    # heuristic calls the search makes on its children) and the totals are
+    # scaled by N. sample=1 times every call, which can slow a fast search
+    # down noticeably.
+    def __init__(self, sample=1):
+        self.sample = sample
+        self.expanded = 0
+        self.generated = 0
+        self.duplicates = 0
+        self.peak_open = 0
+        self.peak_closed = 0
+        # Priority queue operations of A*
+        self.pushes = 0
+        self.pops = 0
+        self.successor_time = 0.0
+        self.heuristic_time = 0.0
+        self.elapsed = 0.0
+        # Processes the search ran in (ParallelBFS may use several)
+        self.workers = 1
+        # Whether the current expansion is timed
+        self.timing = False
+
+    def successors(self, successorsFn):
+        # successorsFn counting expansions and generated children, timed on
+        # sampled expansions
+        perf_counter = time.perf_counter
+        sample = self.sample
+
+        def counted(state):
+            self.expanded += 1
+            if self.expanded % sample:
+                self.timing = False
+                children = successorsFn(state)
+                self.generated += len(children)
+                return children
+
+            self.timing = True
+            start = perf_counter()
+            children = successorsFn(state)
+            self.successor_time += (perf_counter() - start) * sample
+            self.generated += len(children)
+            return children
+
+        return counted
+
+    def heuristic(self, h):
+        # h timed while the current expansion is timed (see successors)
+        perf_counter = time.perf_counter
+        sample = self.sample
+
+        def timed(state):
+            if not self.timing:
+                return h(state)
+            start = perf_counter()
+            value = h(state)
+            self.heuristic_time += (perf_counter() - start) * sample
+            return value
+
+        return timed
+
+    def frontier(self, open_size, closed_size):
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+        if closed_size > self.peak_closed:
+            self.peak_closed = closed_size
+
+    def asDict(self):
+        return {
+            "expanded": self.expanded,
+            "generated": self.generated,
+            "duplicates": self.duplicates,
+            "peak_open": self.peak_open,
+            "peak_closed": self.peak_closed,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "successor_time": round(self.successor_time, 6),
+            "heuristic_time": round(self.heuristic_time, 6),
+            "elapsed": round(self.elapsed, 6),
+            "workers": self.workers,
+            "sample": self.sample,
+        }
+
+    def summary(self):
+        # Short labels for the visualizers' info panel
+        return {
+            "Expanded": self.expanded,
+            "Generated": self.generated,
+            "Duplicates": self.duplicates,
+            "Peak Open/Closed": f"{self.peak_open} / {self.peak_closed}",
+            "Push/Pop": f"{self.pushes} / {self.pops}",
+            "Succ/h time": f"{self.successor_time:.2f}/{self.heuristic_time:.2f}s",
+        }
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value}" for key, value in self.asDict().items())
+        return f"SearchStats({fields})"
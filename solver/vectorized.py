@@ -0,0 +1,169 @@
+# Breadth-first search expanding a whole layer at a time with NumPy. The
+# frontier is an (states x vehicles) array of vehicle positions; every legal
+# slide of every vehicle in every state is found with vectorized occupancy
+# checks, and children are deduplicated by exact layout keys with np.unique
+# against the previous two layers (moves are reversible, so a child of layer d
+# lies in layer d-1, d or d+1). NumPy is optional: nothing here is imported
+# unless this search runs.
+import time
+
+from .bitboard import BitboardState
+from .node import Node
+
+
+def _layerOccupancy(np, info, positions):
+    # (states x height x width) boolean grid of walls and vehicles
+    states = positions.shape[0]
+    grid = np.zeros((states, info.board_height, info.board_width), dtype=bool)
+    for r, c in info.walls:
+        grid[:, r, c] = True
+    rows = np.arange(states)
+    for i, line in enumerate(info.lines):
+        pos = positions[:, i]
+        for k in range(info.lengths[i]):
+            if info.orientations[i] == "H":
+                grid[rows, line, pos + k] = True
+            else:
+                grid[rows, pos + k, line] = True
+    return grid
+
+
+def expandLayer(np, info, positions):
+    # Every child of every state in positions: (child positions, parent row,
+    # moved vehicle). Moves come vehicle by vehicle, left/up before
+    # right/down, shortest first
+    states, vehicles = positions.shape
+    grid = _layerOccupancy(np, info, positions)
+    rows = np.arange(states)
+    parents, moved, new_positions = [], [], []
+
+    for i in range(vehicles):
+        pos = positions[:, i]
+        line, length = info.lines[i], info.lengths[i]
+        horizontal = info.orientations[i] == "H"
+        size = info.board_width if horizontal else info.board_height
+        last = size - length
+
+        # Slide back (left/up) one cell at a time while the entered cell is free,
+        # then forward (right/down) the same way
+        for step in (-1, 1):
+            free = np.ones(states, dtype=bool)
+            for distance in range(1, last + 1):
+                new_pos = pos + step * distance
+                free &= (new_pos >= 0) & (new_pos <= last)
+                # Cell the vehicle enters at this distance (clipped when off the board)
+                cell = np.clip(new_pos if step < 0 else new_pos + length - 1, 0, size - 1)
+                free &= ~(grid[rows, line, cell] if horizontal else grid[rows, cell, line])
+                movable = np.flatnonzero(free)
+                if not len(movable):
+                    break
+                parents.append(movable)
+                moved.append(np.full(len(movable), i, dtype=np.int16))
+                new_positions.append(new_pos[movable])
+
+    if not parents:
+        return positions[:0], np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.int16)
+    parents = np.concatenate(parents)
+    moved = np.concatenate(moved)
+    children = positions[parents]
+    children[np.arange(len(parents)), moved] = np.concatenate(new_positions)
+    return children, parents, moved
+
+
+def layoutKeys(np, info, positions):
+    # One exact key per state: the packed layout as a uint64 when it fits in
+    # 64 bits, otherwise the state's row of positions viewed as one opaque
+    # (void) value, which np.unique and np.isin compare byte for byte
+    vehicles = positions.shape[1]
+    if vehicles * info.pos_bits <= 64:
+        shifts = np.array(info.shifts, dtype=np.uint64)
+        return np.bitwise_or.reduce(positions.astype(np.uint64) << shifts, axis=1)
+    row = np.dtype((np.void, positions.dtype.itemsize * vehicles))
+    return np.ascontiguousarray(positions).view(row).ravel()
+
+
+def _layout(info, row):
+    layout = 0
+    for i, pos in enumerate(row.tolist()):
+        layout |= pos << info.shifts[i]
+    return layout
+
+
+def VectorBFS(s, stats=None):
+    # BFS over whole layers with NumPy (see the module comment). Returns the
+    # same (solution node, elapsed) as BFS, in the state type of s
+    # stats: optional SearchStats; the successor time is the vectorized expansion
+    import numpy as np
+
+    start_time = time.time()
+    start = s if isinstance(s, BitboardState) else s.toBitboard()
+    info = start.info
+    positions = np.array([[start.position(i) for i in range(len(info.vids))]], dtype=np.int16)
+
+    x = info.x_index
+    goal_pos = None
+    if x is not None and info.orientations[x] == "H":
+        goal_pos = info.board_width - info.lengths[x]
+
+    # Per layer: positions and the row of each state's parent in the layer before
+    layers = [(positions, None)]
+    keys = [layoutKeys(np, info, positions)]
+    duplicates = 0
+    visited = 1
+    goal = 0 if goal_pos is not None and positions[0, x] == goal_pos else None
+
+    while goal is None and len(positions):
+        expand_start = time.perf_counter()
+        children, parents, _ = expandLayer(np, info, positions)
+        if stats is not None:
+            stats.expanded += len(positions)
+            stats.generated += len(children)
+            stats.successor_time += time.perf_counter() - expand_start
+
+        # First occurrence of every new key, dropping what the last two layers hold
+        child_keys, first = np.unique(layoutKeys(np, info, children), return_index=True)
+        new = np.ones(len(child_keys), dtype=bool)
+        for earlier in keys[-2:]:
+            new &= ~np.isin(child_keys, earlier, assume_unique=True)
+        first = first[new]
+        duplicates += len(children) - len(first)
+
+        positions = children[first]
+        layers.append((positions, parents[first]))
+        keys.append(child_keys[new])
+        visited += len(positions)
+        if stats is not None:
+            stats.frontier(len(positions), visited)
+
+        if goal_pos is not None:
+            reached = np.flatnonzero(positions[:, x] == goal_pos)
+            if len(reached):
+                goal = int(reached[0])
+
+    node = None
+    if goal is not None:
+        # Rows of the solution in each layer, back to the start
+        rows = [goal]
+        for depth in range(len(layers) - 1, 0, -1):
+            rows.append(int(layers[depth][1][rows[-1]]))
+        rows.reverse()
+
+        node = Node(s, None, None)
+        previous = layers[0][0][0]
+        for depth in range(1, len(rows)):
+            current = layers[depth][0][rows[depth]]
+            i = int(np.flatnonzero(current != previous)[0])
+            delta = int(current[i]) - int(previous[i])
+            back, ahead = info.moves[i]
+            action = back[-delta] if delta < 0 else ahead[delta]
+            state = BitboardState(info, _layout(info, current))
+            if not isinstance(s, BitboardState):
+                state = state.toPuzzle()
+            node = Node(state, node, action, node.g + 1)
+            previous = current
+
+    elapsed = time.time() - start_time
+    if stats is not None:
+        stats.duplicates += duplicates
+        stats.elapsed = elapsed
+    return node, elapsed
@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cacheHome(tmp_path, monkeypatch):
+    # Pattern databases, state space indexes and solutions are cached under
+    # $XDG_CACHE_HOME/rushhour: keep them out of the user's home
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
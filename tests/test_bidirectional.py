@@ -0,0 +1,47 @@
+import os
+import random
+
+from solver import BFS, BidirectionalBFS, RushHourPuzzle
+from solver.generator import randomPuzzle
+from solver.search import GOAL_LIMIT
+from solver.solve import isGoal, successors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_large_board_falls_back_to_bfs():
+    # A random 8x8 board with 14 vehicles has far too many goal layouts to
+    # seed the backward search with
+    start = randomPuzzle(random.Random(1), 8, 8, 14).toBitboard()
+    assert start.info.goalLayouts(start.layout, GOAL_LIMIT) is None
+
+    bfs, _ = BFS(start, successors, isGoal)
+    bidirectional, _ = BidirectionalBFS(start, successors, isGoal)
+    assert len(bidirectional.getSolution()) == len(bfs.getSolution())
+    assert isGoal(bidirectional.getPath()[-1])
+
+
+def test_goal_layouts_under_the_limit():
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, "2-e.csv"))
+    start = puzzle.toBitboard()
+    assert len(start.info.goalLayouts(start.layout, GOAL_LIMIT)) == len(start.info.goalLayouts(start.layout))
+
+
+def test_other_goal_tests_fall_back_to_bfs():
+    # Goal layouts of an arbitrary test cannot be enumerated: X one cell short
+    # of the exit is searched forwards only
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, "1.csv"))
+    puzzle.setBoard()
+    start = puzzle.toBitboard()
+    x = start.info.x_index
+    target = start.info.board_width - start.info.lengths[x] - 1
+
+    def nearExit(state):
+        return state.position(x) == target
+
+    bfs, _ = BFS(start, successors, nearExit)
+    bidirectional, _ = BidirectionalBFS(start, successors, nearExit)
+    assert len(bidirectional.getSolution()) == len(bfs.getSolution())
+    assert nearExit(bidirectional.getPath()[-1])
@@ -0,0 +1,45 @@
+import os
+import random
+
+from solver import RushHourPuzzle, SolutionCache, StateSpace
+from solver.cachefiles import evictFiles
+from solver.generator import randomPuzzle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_disk_tier_stays_under_its_limit(tmp_path):
+    cache = SolutionCache(cache_dir=str(tmp_path), memory_entries=2, disk_entries=10)
+    rng = random.Random(1)
+    solved = []
+    while len(solved) < 25:
+        puzzle = randomPuzzle(rng, 6, 6, 6)
+        if cache.solve(puzzle) is not None:
+            solved.append(puzzle)
+
+    files = [name for name in os.listdir(tmp_path) if name.endswith(".json")]
+    assert len(files) <= 10
+    assert cache.disk_count == len(files)
+    # The most recent entry survived eviction
+    assert SolutionCache(cache_dir=str(tmp_path)).get(solved[-1]) is not None
+
+
+def test_evict_files_removes_the_least_recently_used(tmp_path):
+    for i, name in enumerate(["a.pdb", "b.pdb", "c.pdb", "d.rhss"]):
+        path = tmp_path / name
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (i, i))
+    evictFiles(str(tmp_path), ".pdb", 150, keep=str(tmp_path / "a.pdb"))
+    # a.pdb is kept although it is the oldest; other suffixes are not touched
+    assert sorted(os.listdir(tmp_path)) == ["a.pdb", "d.rhss"]
+
+
+def test_state_space_directory_is_capped(tmp_path):
+    spaces = []
+    for name in ["1.csv", "2-b.csv", "2-c.csv"]:
+        puzzle = RushHourPuzzle()
+        puzzle.setVehicles(os.path.join(ROOT, name))
+        spaces.append(StateSpace(puzzle, str(tmp_path), cache_bytes=50000))
+    # 2-c alone (92 kB) is over the limit, so only the newest index stays
+    assert os.listdir(tmp_path) == [os.path.basename(spaces[-1].path)]
+    assert spaces[-1].distance(puzzle) == 58
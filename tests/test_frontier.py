@@ -0,0 +1,42 @@
+import pytest
+
+from solver.frontier import BucketQueue
+
+
+def test_bucket_queue_pops_the_lowest_f_first():
+    queue = BucketQueue()
+    for f, item in [(5, "a"), (2, "b"), (7, "c"), (3, "d")]:
+        queue.push(f, 0, item)
+    assert [queue.pop() for _ in range(len(queue))] == [(2, "b"), (3, "d"), (5, "a"), (7, "c")]
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_bucket_queue_lifo_ties():
+    queue = BucketQueue("lifo")
+    for item in "abc":
+        queue.push(4, 0, item)
+    assert [queue.pop()[1] for _ in range(3)] == ["c", "b", "a"]
+
+
+def test_bucket_queue_h_ties():
+    # Lowest h first, newest among equal h
+    queue = BucketQueue("h")
+    for h, item in [(2, "a"), (0, "b"), (2, "c"), (0, "d"), (1, "e")]:
+        queue.push(6, h, item)
+    assert [queue.pop()[1] for _ in range(5)] == ["d", "b", "e", "c", "a"]
+
+
+def test_bucket_queue_push_below_the_minimum():
+    # An inconsistent heuristic can push an f lower than the last one popped
+    queue = BucketQueue()
+    queue.push(4, 0, "a")
+    queue.push(6, 0, "b")
+    assert queue.pop() == (4, "a")
+    queue.push(3, 0, "c")
+    assert [queue.pop() for _ in range(2)] == [(3, "c"), (6, "b")]
+
+
+def test_bucket_queue_rejects_unknown_tie_break():
+    with pytest.raises(ValueError):
+        BucketQueue("fifo")
@@ -0,0 +1,86 @@
+import glob
+import os
+import pickle
+
+import pytest
+
+from solver import AStar, BFS, BitboardState, Node, RushHourPuzzle, h2, h3, h4
+from solver.heuristics import boardCache
+from solver.solve import isGoal, successors
+from solver.statespace import goalDistances
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PUZZLES = sorted(os.path.basename(path) for path in glob.glob(os.path.join(ROOT, "*.csv")))
+# Boards whose reachable states are all checked; 2-a (540000 states) takes
+# over half a minute to enumerate
+EXHAUSTIVE_STATES = 70000
+
+
+def load(name):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, name))
+    puzzle.setBoard()
+    return puzzle
+
+
+def wallInXRow(tmp_path):
+    path = tmp_path / "wall.csv"
+    path.write_text("6,6\nX,0,2,H,2\nA,2,1,V,2\n#,4,2\n")
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(str(path))
+    puzzle.setBoard()
+    return puzzle
+
+
+def test_wall_in_x_row(tmp_path):
+    puzzle = wallInXRow(tmp_path)
+    for state in (puzzle, puzzle.toBitboard()):
+        # h1 (4) plus vehicle A (1 move); the wall is not a vehicle
+        assert h3(Node(state)) == 5
+        assert h2(Node(state)) == 6
+        assert h4(Node(state)) == float("inf")
+        solution, _ = AStar(state, successors, isGoal, h3)
+        assert solution is None
+
+
+@pytest.mark.parametrize("name", PUZZLES)
+def test_h4_never_exceeds_the_exact_distance(name):
+    start = load(name).toBitboard()
+    space = goalDistances(start.info, start.layout, EXHAUSTIVE_STATES)
+    if space is None:
+        pytest.skip(f"more than {EXHAUSTIVE_STATES} reachable states")
+    _, distance = space
+    for layout, d in distance.items():
+        assert h4.evaluate(BitboardState(start.info, layout)) <= d
+
+
+@pytest.mark.parametrize("name", PUZZLES)
+def test_h4_astar_finds_the_bfs_cost(name):
+    puzzle = load(name)
+    bfs, _ = BFS(puzzle, successors, isGoal)
+    astar, _ = AStar(puzzle, successors, isGoal, h4)
+    assert len(astar.getSolution()) == len(bfs.getSolution())
+
+
+def test_memo_is_keyed_by_layout_not_hash():
+    # States given the same Zobrist hash must not share a memoized value
+    puzzle = load("2-a.csv")
+    # Children made after it share the board's memo
+    boardCache(puzzle)
+    children = [child for _, child in puzzle.successorFunction()]
+    expected = [h4.fn(child, boardCache(child)) for child in children]
+    assert len(set(expected)) > 1
+    for child in children:
+        child._hash = hash(puzzle)
+    assert [h4.evaluate(child) for child in children] == expected
+
+
+def test_memo_is_not_pickled():
+    puzzle = load("2-e.csv")
+    start = puzzle.toBitboard()
+    solution, _ = AStar(start, successors, isGoal, h4)
+    assert start.info.heuristic_cache.memos
+    for state in (puzzle, start):
+        copy = pickle.loads(pickle.dumps(state))
+        assert copy.heuristic_cache is None and copy == state
+        assert h4.evaluate(copy) == h4.evaluate(state)
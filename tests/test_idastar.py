@@ -0,0 +1,28 @@
+import random
+
+from solver import BFS, IDAStar, RushHourPuzzle, SearchStats, h2, h4
+from solver.generator import randomPuzzle
+from solver.solve import isGoal, successors
+
+
+def test_root_evicted_from_a_small_table():
+    # The table is far smaller than the search, so the root's entry is evicted
+    puzzle = randomPuzzle(random.Random(13), 6, 6, 8)
+    bfs, _ = BFS(puzzle, successors, isGoal)
+    solution, _ = IDAStar(puzzle, successors, isGoal, h4, table_size=5)
+    assert len(solution.getSolution()) == len(bfs.getSolution())
+
+
+def test_unsolvable_board_stops(tmp_path):
+    # X is walled in; its 13 reachable states have a finite h2
+    path = tmp_path / "walled.csv"
+    path.write_text("6,6\nX,0,2,H,2\nA,3,0,V,2\n#,4,2\n")
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(str(path))
+    puzzle.setBoard()
+
+    for start in (puzzle, puzzle.toBitboard()):
+        stats = SearchStats()
+        solution, _ = IDAStar(start, successors, isGoal, h2, stats=stats)
+        assert solution is None
+        assert stats.expanded < 100
@@ -0,0 +1,25 @@
+import os
+
+from solver import AStar, BFS, Move, RushHourPuzzle, h2
+from solver.solve import isGoal, replaySolution, successors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_move_is_not_a_string():
+    move = Move("A", "left", 2)
+    assert str(move) == "Move A left 2"
+    assert move != "Move A left 2"
+    assert move == Move("A", "left", 2) and hash(move) == hash(Move("A", "left", 2))
+
+
+def test_solution_text_replays():
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, "1.csv"))
+    puzzle.setBoard()
+    start = puzzle.toBitboard()
+    for solution, _ in (BFS(start, successors, isGoal), AStar(start, successors, isGoal, h2)):
+        actions = solution.getSolution()
+        assert all(isinstance(action, str) for action in actions)
+        replayed = replaySolution(puzzle, actions)
+        assert replayed.getSolution() == actions and replayed.state.isGoal()
@@ -0,0 +1,57 @@
+import os
+
+from solver import AStar, BFS, NodeTable, RushHourPuzzle, TableNode, h4
+from solver.solve import isGoal, successors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(name):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, name))
+    puzzle.setBoard()
+    return puzzle
+
+
+def test_node_table_solution():
+    puzzle = load("1.csv")
+    table = NodeTable()
+    root = table.add(-1, None, 0)
+    # Two branches from the root; only the path to the last node counts
+    state = puzzle
+    index = root
+    actions = []
+    for g in range(1, 4):
+        action, state = state.successorFunction()[0]
+        table.add(index, state.successorFunction()[-1][0], g)
+        index = table.add(index, action, g)
+        actions.append(str(action))
+
+    assert table.solution(index) == actions
+    assert table.g[index] == 3 and table.solution(root) == []
+
+    node = TableNode(table, index, puzzle, state)
+    path = node.getPath()
+    assert len(path) == 4 and path[0] == puzzle and path[-1] == state
+
+
+def test_astar_path_matches_its_solution():
+    puzzle = load("2-b.csv")
+    bfs, _ = BFS(puzzle, successors, isGoal)
+    for start in (puzzle, puzzle.toBitboard()):
+        solution, _ = AStar(start, successors, isGoal, h4)
+        actions = solution.getSolution()
+        path = solution.getPath()
+        assert len(actions) == len(bfs.getSolution()) == solution.g
+        assert len(path) == len(actions) + 1 and path[0] == start and isGoal(path[-1])
+        # Each state follows from the previous one by the recorded move
+        for parent, action, child in zip(path, actions, path[1:]):
+            assert any(str(a) == action and c == child for a, c in parent.successorFunction())
+
+        # Node's attributes: parent chain, the Move that led to each node, f
+        assert solution.f == solution.g and str(solution.action) == actions[-1]
+        node = solution
+        for state in reversed(path):
+            assert node.state == state
+            node = node.parent
+        assert node is None
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from solver import BFS, RushHourPuzzle
+from solver.solve import ALGORITHMS, OPTIMAL_ALGORITHMS, isGoal, successors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(name, bitboard):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, name))
+    puzzle.setBoard()
+    return puzzle.toBitboard() if bitboard else puzzle
+
+
+# 2-b.csv has a wall
+@pytest.mark.parametrize("bitboard", [False, True], ids=["grid", "bitboard"])
+@pytest.mark.parametrize("name", ["1.csv", "2-b.csv"])
+@pytest.mark.parametrize("algorithm", sorted(OPTIMAL_ALGORITHMS))
+def test_optimal_algorithm_finds_the_bfs_cost(algorithm, name, bitboard):
+    start = load(name, bitboard)
+    bfs, _ = BFS(start, successors, isGoal)
+    solution, _ = ALGORITHMS[algorithm](start, successors)
+    assert len(solution.getSolution()) == len(bfs.getSolution())
+    path = solution.getPath()
+    assert path[0] == start and isGoal(path[-1])
@@ -0,0 +1,37 @@
+import multiprocessing
+import os
+from types import SimpleNamespace
+
+from solver import BFS, ParallelBFS, RushHourPuzzle
+from solver.solve import isGoal, successors
+from solver.stats import SearchStats
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _puzzle(name):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, name))
+    puzzle.setBoard()
+    return puzzle
+
+
+def test_workers_are_recorded():
+    puzzle = _puzzle("1.csv")
+    bfs, _ = BFS(puzzle, successors, isGoal)
+    stats = SearchStats()
+    solution, _ = ParallelBFS(puzzle, successors, isGoal, workers=2, stats=stats)
+    assert len(solution.getSolution()) == len(bfs.getSolution())
+    assert stats.workers == 2
+    assert stats.asDict()["workers"] == 2
+
+
+def test_daemon_process_runs_a_single_partition(monkeypatch):
+    # Daemon processes cannot start children: the search stays in-process
+    monkeypatch.setattr(multiprocessing, "current_process", lambda: SimpleNamespace(daemon=True))
+    puzzle = _puzzle("1.csv")
+    bfs, _ = BFS(puzzle, successors, isGoal)
+    stats = SearchStats()
+    solution, _ = ParallelBFS(puzzle, successors, isGoal, workers=4, stats=stats)
+    assert len(solution.getSolution()) == len(bfs.getSolution())
+    assert stats.workers == 1
@@ -0,0 +1,37 @@
+import os
+import time
+
+from solver import RushHourPuzzle, solve
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(name):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, name))
+    puzzle.setBoard()
+    return puzzle
+
+
+# Passed to solve_portfolio as functions rather than registered in
+# ALGORITHMS, so they reach the workers whether processes are forked or spawned
+def dies(puzzle, successorsFn, stats=None):
+    os._exit(1)
+
+
+def hangs(puzzle, successorsFn, stats=None):
+    time.sleep(60)
+
+
+def test_portfolio_gives_up_on_a_dead_worker():
+    started = time.time()
+    solutions = solve.solve_portfolio(load("1.csv"), algorithms={"BFS": None, "dies": dies})
+    assert list(solutions) == ["BFS"]
+    assert time.time() - started < 10
+
+
+def test_portfolio_timeout_stops_a_hung_worker():
+    started = time.time()
+    solutions = solve.solve_portfolio(load("1.csv"), algorithms={"BFS": None, "hangs": hangs}, timeout=2)
+    assert list(solutions) == ["BFS"]
+    assert time.time() - started < 10
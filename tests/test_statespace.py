@@ -0,0 +1,34 @@
+import os
+
+from solver import BFS, RushHourPuzzle, StateSpace
+from solver.solve import isGoal, replaySolution, successors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_lookup_after_reloading_the_index(tmp_path, monkeypatch):
+    puzzle = RushHourPuzzle()
+    puzzle.setVehicles(os.path.join(ROOT, "1.csv"))
+    puzzle.setBoard()
+    built = StateSpace(puzzle, str(tmp_path))
+    assert os.path.exists(built.path)
+
+    # The second instance must map the saved file instead of enumerating again
+    def enumerate_again(self):
+        raise AssertionError("index enumerated again")
+
+    monkeypatch.setattr(StateSpace, "_enumerate", enumerate_again)
+    space = StateSpace(puzzle, str(tmp_path))
+    assert len(space) == len(built)
+
+    bfs, _ = BFS(puzzle, successors, isGoal)
+    cost = len(bfs.getSolution())
+    assert space.distance(puzzle) == cost
+    assert space.distance(puzzle.toBitboard()) == cost
+    # Every state of an optimal path is one move closer
+    for d, state in enumerate(bfs.getPath()):
+        assert space.distance(state) == cost - d
+
+    actions = space.solution(puzzle)
+    assert len(actions) == cost
+    assert replaySolution(puzzle, actions).state.isGoal()
@@ -0,0 +1,27 @@
+import random
+
+import pytest
+
+from solver import BFS
+from solver.generator import randomPuzzle
+from solver.solve import isGoal, successors
+
+np = pytest.importorskip("numpy")
+from solver.vectorized import VectorBFS, layoutKeys  # noqa: E402
+
+
+def test_layouts_wider_than_64_bits_are_compared_exactly():
+    # 27 vehicles of 4 position bits each: 108-bit layouts, solved in 9 moves
+    puzzle = randomPuzzle(random.Random(13), 8, 8, 26)
+    start = puzzle.toBitboard()
+    assert len(start.info.vids) * start.info.pos_bits > 64
+
+    rows = np.random.default_rng(1).integers(0, 4, size=(5000, len(start.info.vids)), dtype=np.int16)
+    keys = layoutKeys(np, start.info, rows)
+    assert len(np.unique(keys)) == len(np.unique(rows, axis=0))
+
+    bfs, _ = BFS(start, successors, isGoal)
+    for state in (puzzle, start):
+        solution, _ = VectorBFS(state)
+        assert len(solution.getSolution()) == len(bfs.getSolution())
+        assert isGoal(solution.getPath()[-1])